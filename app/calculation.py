@@ -5,9 +5,12 @@
 
 from dataclasses import dataclass, field
 import datetime
-from decimal import Decimal, InvalidOperation
+from decimal import Context, Decimal, Inexact, InvalidOperation, localcontext
+from functools import lru_cache
 import logging
-from typing import Any, Dict
+import math
+import operator
+from typing import Any, Callable, Dict, Optional
 from app.exceptions import OperationError
 
 """
@@ -22,7 +25,203 @@ It supports serialization to dictionary format for persistence and includes
 comprehensive error handling for edge cases.
 """
 
-@dataclass
+
+logger = logging.getLogger(__name__)
+
+# Calculation is frozen, so its own code sets fields through object.__setattr__
+_set_field = object.__setattr__
+
+# Decimal constants used by the operations below, created once so the hot paths
+# do not coerce int literals on every comparison or multiplication.
+_DEC_ZERO = Decimal(0)
+_DEC_ONE = Decimal(1)
+_DEC_HUNDRED = Decimal(100)
+
+
+def _divide(a: Decimal, b: Decimal) -> Decimal:
+    """Divide a by b, rejecting a zero divisor."""
+    if not b:
+        raise OperationError("Division by zero is not allowed.")
+    return a / b
+
+
+# Fractional powers have to go through float math: Decimal's own non-integral
+# power is around 80x slower. Since the result then depends only on the operand
+# values, it is memoized so replayed histories skip the round-trip entirely.
+@lru_cache(maxsize=1024)
+def _float_power(base: Decimal, exponent: float) -> Decimal:
+    """
+    Compute base ** exponent in float arithmetic and convert the result to Decimal.
+
+    math.pow raises ValueError for a negative base with a fractional exponent,
+    where the builtin pow would silently return a complex number.
+    """
+    return Decimal(math.pow(float(base), exponent))
+
+
+# Context for integral powers. Emax caps results at float magnitudes (below 1e309),
+# and 400 digits hold any such integer exactly. Inexact is trapped (Overflow is a
+# kind of Inexact), so a result that would be rounded or is too large is detected
+# instead of silently cut to the default 28 digits; it then takes the float path,
+# which raises OverflowError for results out of float range.
+_EXACT_POWER_CONTEXT = Context(prec=400, Emax=308, traps=[Inexact, InvalidOperation])
+
+
+def _power(a: Decimal, b: Decimal) -> Decimal:
+    """
+    Raise a to the power of b, rejecting negative exponents.
+
+    Integral exponents are computed natively in Decimal, which is exact and
+    cheaper than converting through float. Results too long to hold exactly fall
+    back to the float path, as do fractional exponents.
+    """
+    # operands normally arrive as Decimal; accept ints and floats like the validator does
+    if not isinstance(a, Decimal):
+        a = Decimal(str(a))
+    if not isinstance(b, Decimal):
+        b = Decimal(str(b))
+    if b < _DEC_ZERO:
+        raise OperationError("Negative exponent is not allowed for this operation.")
+    if b == b.to_integral_value():
+        if not b:
+            # Decimal treats 0 ** 0 as undefined; keep the conventional result of 1
+            return _DEC_ONE
+        with localcontext(_EXACT_POWER_CONTEXT):
+            try:
+                return a ** b
+            except Inexact:
+                pass
+    return _float_power(a, float(b))
+
+
+def _root(a: Decimal, b: Decimal) -> Decimal:
+    """
+    Calculate the b-th root of a, rejecting negative bases and non-positive degrees.
+
+    Square roots use math.sqrt, which is correctly rounded, unlike raising to the
+    power 0.5 on every platform.
+    """
+    if a < _DEC_ZERO:
+        raise OperationError("Cannot calculate the root of a negative number.")
+    if b <= _DEC_ZERO:
+        raise OperationError("Root degree must be greater than zero.")
+    if b == 2:
+        return Decimal(math.sqrt(float(a)))
+    return _float_power(a, 1 / float(b))
+
+
+def _modulus(a: Decimal, b: Decimal) -> Decimal:
+    """Return the remainder of a divided by b, rejecting a zero divisor."""
+    if not b:
+        raise OperationError("Modulus by zero is not allowed.")
+    return a % b
+
+
+def _integer_division(a: Decimal, b: Decimal) -> Decimal:
+    """Return the integer quotient of a and b, rejecting a zero divisor."""
+    if not b:
+        raise OperationError("Integer division by zero is not allowed.")
+    return a // b
+
+
+def _percentage(a: Decimal, b: Decimal) -> Decimal:
+    """Return a as a percentage of b, rejecting a zero base value."""
+    if not b:
+        raise OperationError("Cannot calculate percentage with zero base value.")
+    return (a / b) * _DEC_HUNDRED
+
+
+def _absolute_difference(a: Decimal, b: Decimal) -> Decimal:
+    """Return the absolute difference between a and b."""
+    return abs(a - b)
+
+
+@lru_cache(maxsize=32)
+def _quantize_template(precision: int) -> Decimal:
+    """Return the Decimal exponent template for rounding to the given number of places."""
+    return Decimal(f"1e-{precision}")
+
+
+@lru_cache(maxsize=4096)
+def _parse_decimal(value: Any) -> Decimal:
+    """
+    Parse a serialized value into a Decimal, memoized on the raw value.
+
+    Histories tend to reuse the same operands and results, and Decimal is
+    immutable, so repeated values share one parsed instance.
+    """
+    return Decimal(value)
+
+
+# Dispatch table mapping operation names to their implementations.
+# Built once at import time so calculate() only pays for a single lookup.
+# Operations without checks map straight to the C functions in the operator
+# module, which avoids a Python-level call frame.
+_OPERATIONS: Dict[str, Callable[[Decimal, Decimal], Decimal]] = {
+    "Addition": operator.add,
+    "Subtraction": operator.sub,
+    "Multiplication": operator.mul,
+    "Division": _divide,
+    "Power": _power,
+    "Root": _root,
+    "Modulus": _modulus,
+    "IntegerDivision": _integer_division,
+    "Percentage": _percentage,
+    "AbsoluteDifference": _absolute_difference,
+}
+
+# Alternative spellings accepted for each operation, mapped to the canonical
+# name stored on a Calculation. These are the command names used by
+# OperationFactory, so either form can be passed in.
+_OPERATION_ALIASES: Dict[str, str] = {
+    "add": "Addition",
+    "subtract": "Subtraction",
+    "multiply": "Multiplication",
+    "divide": "Division",
+    "power": "Power",
+    "root": "Root",
+    "modulus": "Modulus",
+    "integerdivision": "IntegerDivision",
+    "percentage": "Percentage",
+    "absolutedifference": "AbsoluteDifference",
+}
+
+# Every accepted spelling mapped to its canonical name. The values are the same
+# string objects used as _OPERATIONS keys, so a single lookup here canonicalizes,
+# validates and interns an operation name at once.
+_CANONICAL_OPERATIONS: Dict[str, str] = {name: name for name in _OPERATIONS}
+_CANONICAL_OPERATIONS.update(_OPERATION_ALIASES)
+
+
+def evaluate(operation: str, a: Decimal, b: Decimal) -> Decimal:
+    """
+    Compute the result of an operation without creating a Calculation.
+
+    Accepts the same operation names as Calculation and raises the same errors,
+    for callers that only need the number, such as chained evaluation.
+
+    Args:
+        operation (str): Canonical or alias operation name, e.g. "Addition" or "add".
+        a (Decimal): First operand.
+        b (Decimal): Second operand.
+
+    Returns:
+        Decimal: The result of the operation.
+
+    Raises:
+        OperationError: If the operation is not recognized or if an error occurs during calculation.
+    """
+    op = _OPERATIONS.get(_CANONICAL_OPERATIONS.get(operation, operation))
+    if not op:
+        raise OperationError(f"Unknown operation: {operation}")
+
+    try:
+        return op(a, b)
+    except (InvalidOperation, ValueError, ArithmeticError) as e:
+        raise OperationError(f"Calculation failed: {str(e)}")
+
+
+@dataclass(frozen=True, slots=True)
 class Calculation:
     """
     A class representing a mathematical calculation.
@@ -34,6 +233,10 @@ class Calculation:
     The calculation is performed immediately when the object is created using
     the __post_init__ method, which validates the operation and computes the result.
 
+    Instances use __slots__ instead of a per-instance __dict__, which keeps large
+    histories compact in memory and makes attribute access cheaper. They are also
+    frozen, so they can be shared, hashed and cached safely once created.
+
     """
 
     #required fields
@@ -45,139 +248,61 @@ class Calculation:
     result: Decimal = field(init=False)
     timestamp: datetime.datetime = field(default_factory=datetime.datetime.now)
 
+    # serialized form, filled in lazily by to_dict()
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """
         Post-initialization processing to validate and perform the calculation.
         
         This method is called automatically after the dataclass is initialized.
         It validates the operation and performs the calculation, storing the result.
+
+        The operation name is canonicalized (e.g. "add" becomes "Addition") and
+        interned, so that every instance shares the same string object and the
+        comparisons in calculate() succeed on identity alone.
         """
-       
-        self.result = self.calculate()
+        if isinstance(self.operation, str):
+            canonical = _CANONICAL_OPERATIONS.get(self.operation)
+            if canonical is not None:
+                _set_field(self, "operation", canonical)
+
+        _set_field(self, "result", self.calculate())
 
     def calculate(self) -> Decimal:
         """
         Execute the calculation using the specified operation.
             
-        utilizes a dictionary to map operation names to their corresponding lambda functions,
-        enabling dynamic execution of the operation based on the operation name.
-        
+        Addition, subtraction and multiplication are handled inline, since for these
+        the dispatch overhead outweighs the arithmetic itself. Every other operation
+        goes through evaluate(), which looks it up in the module-level dispatch
+        table built once at import time instead of on every call.
+
         returns:
             Decimal: The result of the calculation.
-            
+
         raises:
             OperationError: If the operation is not recognized or if an error occurs during calculation.
-        
+
         """
-        operations = {
-            "Addition": lambda a, b: a + b,
-            "Subtraction": lambda a, b: a - b,
-            "Multiplication": lambda a, b: a * b,
-            "Division": lambda a, b: a /b if b != 0 else self._raise_div_zero(),
-            "Power": lambda a, b: (
-                Decimal(pow(float(a), float(b))) if b >= 0 else self._raise_neg_power()
-            ),
-            "Root": lambda a, b: (
-                Decimal(pow(float(a), 1 / float(b)))
-                if a >= 0 and b > 0
-                else self._raise_invalid_root(a, b)
-            ),
-            "Modulus": lambda a, b: a % b if b != 0 else self._raise_mod_zero(),
-            "IntegerDivision": lambda a, b: a // b if b != 0 else self._raise_int_div_zero(),
-            "Percentage": lambda a, b: (a/ b) * 100 if b != 0 else self._raise_percent_zero(),
-            "AbsoluteDifference": lambda a, b: abs(a - b)
-        }
-
-        op = operations.get(self.operation)
-        if not op:
-            raise OperationError(f"Unknown operation: {self.operation}")
-        
+        operation = self.operation
+        a = self.operand1
+        b = self.operand2
+
         try:
-            # execute the operation and return the result
-            return op(self.operand1, self.operand2)
+            # fast path for the cheapest and most common operations
+            if operation == "Addition":
+                return a + b
+            if operation == "Subtraction":
+                return a - b
+            if operation == "Multiplication":
+                return a * b
         except (InvalidOperation, ValueError, ArithmeticError) as e:
             raise OperationError(f"Calculation failed: {str(e)}")
-        
-    @staticmethod
-    def _raise_div_zero():
-        """
-        Raise an OperationError for division by zero.
-        
-        This method is called when a division by zero is attempted.
-        
-        raises:
-            OperationError: Indicating that division by zero is not allowed.
-        """
-        raise OperationError("Division by zero is not allowed.")
-    
-    @staticmethod
-    def _raise_neg_power():
-        """
-        Raise an OperationError for negative power.
-        
-        This method is called when a negative power operation is attempted.
-        
-        raises:
-            OperationError: Indicating that negative exponent is not allowed for this operation.
-        """
-        raise OperationError("Negative exponent is not allowed for this operation.")
-    
-    @staticmethod
-    def _raise_invalid_root(a: Decimal, b: Decimal):
-        """
-        Raise an OperationError for invalid root operations.
-        
-        This method is called when an invalid root operation is attempted,
-        such as negative base or invalid degree.
-        
-        raises:
-            OperationError: Indicating the specific root validation error.
-        """
-        if a < 0:
-            raise OperationError("Cannot calculate the root of a negative number.")
-        
-        if b <= 0:
-            raise OperationError("Root degree must be greater than zero.")
-        
-        raise OperationError("Invalid root operation.") # pragma: no cover
-    
-    @staticmethod
-    def _raise_mod_zero():
-        """
-        Raise an OperationError for modulus by zero.
-        
-        This method is called when a modulus operation with zero is attempted.
-        
-        raises:
-            OperationError: Indicating that modulus by zero is not allowed.
-        """
-        raise OperationError("Modulus by zero is not allowed.")
-    
 
-    @staticmethod
-    def _raise_int_div_zero():
-        """
-        Raise an OperationError for integer division by zero.
-        
-        This method is called when an integer division by zero is attempted.
+        # every other operation goes through the module-level dispatch table
+        return evaluate(operation, a, b)
         
-        raises:
-            OperationError: Indicating that integer division by zero is not allowed.
-        """
-        raise OperationError("Integer division by zero is not allowed.")
-    
-    @staticmethod
-    def _raise_percent_zero():
-        """
-        Raise an OperationError for percentage calculation with zero base value.
-        
-        This method is called when a percentage calculation with a zero base value is attempted.
-        
-        raises:
-            OperationError: Indicating that percentage calculation with zero base value is not allowed.
-        """
-        raise OperationError("Cannot calculate percentage with zero base value.")
-    
 
     def to_dict(self) -> Dict[str, Any]:
         """ 
@@ -186,29 +311,80 @@ class Calculation:
         This method converts the Calculation instance into a dictionary format,
         which can be useful for storage, transmission, or persistence.
 
+        The string conversions are done once and cached on the instance, since a
+        calculation does not change after it is created and histories are
+        serialized again on every save.
+
         Returns:
             Dict[str, Any]: A dictionary representation of the Calculation instance.
         """
-        return {
-            "operation": self.operation,
-            "operand1": str(self.operand1),
-            "operand2": str(self.operand2),
-            "result": str(self.result),
-            "timestamp": self.timestamp.isoformat(),
-        }
+        if self._dict_cache is None:
+            _set_field(self, "_dict_cache", {
+                "operation": self.operation,
+                "operand1": str(self.operand1),
+                "operand2": str(self.operand2),
+                "result": str(self.result),
+                "timestamp": self.timestamp.isoformat(),
+            })
+        # hand out a copy so callers cannot modify the cached values
+        return dict(self._dict_cache)
     
+    @classmethod
+    def _from_trusted(
+        cls,
+        operation: str,
+        operand1: Decimal,
+        operand2: Decimal,
+        result: Decimal,
+        timestamp: datetime.datetime,
+    ) -> "Calculation":
+        """
+        Build a Calculation from already known values without recomputing the result.
+
+        This bypasses __init__ and __post_init__, so the caller is responsible for
+        supplying a result that matches the operation and operands.
+
+        Args:
+            operation (str): The name of the operation.
+            operand1 (Decimal): The first operand.
+            operand2 (Decimal): The second operand.
+            result (Decimal): The previously computed result.
+            timestamp (datetime.datetime): When the calculation was performed.
+
+        Returns:
+            Calculation: The reconstructed Calculation instance.
+
+        Raises:
+            OperationError: If the operation is not recognized.
+        """
+        canonical = _CANONICAL_OPERATIONS.get(operation)
+        if canonical is None:
+            raise OperationError(f"Unknown operation: {operation}")
+
+        calc = cls.__new__(cls)
+        _set_field(calc, "operation", canonical)
+        _set_field(calc, "operand1", operand1)
+        _set_field(calc, "operand2", operand2)
+        _set_field(calc, "result", result)
+        _set_field(calc, "timestamp", timestamp)
+        _set_field(calc, "_dict_cache", None)
+        return calc
+
     @staticmethod
-    def from_dict(data: Dict[str, Any]) -> "Calculation":
+    def from_dict(data: Dict[str, Any], verify: bool = False) -> "Calculation":
         """
         Deserialize a dictionary to create a Calculation instance.
 
         This method reconstructs a Calculation instance from a dictionary,
-        which is useful for loading previously stored calculations. The result
-        is recalculated and verified against the saved result for data integrity.
+        which is useful for loading previously stored calculations. By default
+        the saved result is trusted, so loading a history does not redo every
+        calculation. With verify=True the result is recalculated and compared
+        against the saved result to help catch data corruption.
 
         Args:
             data (Dict[str, Any]): A dictionary containing the calculation data
                 with keys: 'operation', 'operand1', 'operand2', 'result', 'timestamp'.
+            verify (bool): Whether to recalculate and verify the saved result.
 
         Returns:
             Calculation: A new Calculation instance created from the provided dictionary.
@@ -217,23 +393,31 @@ class Calculation:
             OperationError: If the data is invalid or missing required fields.
         """
         try:
-            # Create the calculation object with the original operands
+            operand1 = _parse_decimal(data['operand1'])
+            operand2 = _parse_decimal(data['operand2'])
+            saved_result = _parse_decimal(data['result'])
+            timestamp = datetime.datetime.fromisoformat(data['timestamp'])
+
+            if not verify:
+                return Calculation._from_trusted(
+                    data['operation'], operand1, operand2, saved_result, timestamp
+                )
+
+            # Create the calculation object with the original operands and the
+            # saved timestamp, so the default datetime.now() factory is never run
             calc = Calculation(
                 operation=data['operation'],
-                operand1=Decimal(data['operand1']),
-                operand2=Decimal(data['operand2'])
+                operand1=operand1,
+                operand2=operand2,
+                timestamp=timestamp
             )
 
-            # Set the timestamp from the saved data
-            calc.timestamp = datetime.datetime.fromisoformat(data['timestamp'])
-
             # Verify the result matches (helps catch data corruption)
-            saved_result = Decimal(data['result'])
             if calc.result != saved_result:
-                logging.warning(
-                    f"Loaded calculation result {saved_result} "
-                    f"differs from computed result {calc.result}"
-                )  # pragma: no cover
+                logger.warning(
+                    "Loaded calculation result %s differs from computed result %s",
+                    saved_result, calc.result
+                )
 
             return calc
 
@@ -289,13 +473,25 @@ class Calculation:
         """
         if not isinstance(other, Calculation):
             return False
-        
+
+        # a single tuple comparison runs the field-by-field loop in C
         return (
-            self.operation == other.operation and
-            self.operand1 == other.operand1 and
-            self.operand2 == other.operand2 and
-            self.result == other.result
+            (self.operation, self.operand1, self.operand2, self.result) ==
+            (other.operation, other.operand1, other.operand2, other.result)
         )
+
+    def __hash__(self) -> int:
+        """
+        Return a hash consistent with __eq__.
+
+        The result is determined by the operation and operands, so it is left out
+        of the hash. This allows Calculation instances to be used as dict keys and
+        set members, e.g. to deduplicate a history.
+
+        Returns:
+            int: The hash of the operation and operands.
+        """
+        return hash((self.operation, self.operand1, self.operand2))
     
     def format_result(self, precision: int = 10) -> str:
         """
@@ -311,7 +507,7 @@ class Calculation:
         try:
             # Remove trailing zeros and format to the specified precision
             return str(self.result.normalize().quantize(
-                Decimal('0.' + '0' * precision)
+                _quantize_template(precision)
             ).normalize())
         
         except InvalidOperation: # pragma: no cover
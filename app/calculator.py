@@ -12,8 +12,9 @@ Key Concepts:
 -Integration of Design Patterns: The Calculator class will utilize the
  Memento, Observer, and Strategy patterns to manage its operations and history.
 
--Data Persistence with pandas and csv: The Calculator will save its history
- to a CSV file using pandas, allowing for easy data manipulation and retrieval.
+-Data Persistence with csv: The Calculator will save its history to a CSV file
+ using the standard library csv module, and can expose it as a pandas DataFrame
+ for easy data manipulation and retrieval.
 
 -Logging: The Calculator will log operations and errors using the logging module,
  providing a clear audit trail of all calculations performed.
@@ -21,12 +22,15 @@ Key Concepts:
 
 """
 
+from collections import deque
+import csv
 from decimal import Decimal
+from functools import lru_cache, partial
 import logging
 import os
 from pathlib import Path
-from typing import List, Optional, Union, Any, Dict
-import pandas as pd
+import threading
+from typing import TYPE_CHECKING, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from app.calculation import Calculation
 from app.calculator_config import CalculatorConfig
@@ -34,13 +38,49 @@ from app.calculator_memento import CalculatorMemento
 from app.exceptions import OperationError, ValidationError
 from app.history import HistoryObserver
 from app.input_validators import InputValidator
-from app.operations import Operation
+from app.operations import Operation, Root
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Future, ThreadPoolExecutor
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
 
 
 # Define type aliases for better readability
 Number = Union[int, float, Decimal]
 CalculationResult = Union[Decimal, str]
 
+# Column order of the history CSV file
+_HISTORY_COLUMNS = ['operation', 'operand1', 'operand2', 'result', 'timestamp']
+
+# Operations costly enough to be worth memoizing. Root always goes through float
+# math, so its result depends only on operand values and equal Decimals can share
+# an entry. Power is not listed: integral powers are computed in Decimal and carry
+# the operands' exponents (2.0 ** 3 is 8.000, 2 ** 3 is 8), so a value-keyed cache
+# would return whichever form ran first. Its float branch is memoized in
+# app.calculation instead. Cheap Decimal operations are not cached either.
+_MEMOIZED_OPERATIONS = frozenset({Root})
+
+# Maximum number of validated operand strings remembered per calculator
+_VALIDATION_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=1024)
+def _cached_execute(operation_class: type, a: Decimal, b: Decimal) -> Decimal:
+    """
+    Execute a stateless operation, memoizing the result per operand pair.
+
+    Args:
+        operation_class (type): Operation subclass listed in _MEMOIZED_OPERATIONS.
+        a (Decimal): First operand.
+        b (Decimal): Second operand.
+
+    Returns:
+        Decimal: Result of the operation.
+    """
+    return operation_class().execute(a, b)
+
 
 class Calculator:
     """
@@ -49,6 +89,15 @@ class Calculator:
     This class provides methods for performing calculations, managing history, and handling configuration.
     It uses the Memento pattern for undo/redo functionality and the Observer pattern for history management.
     """
+
+    # fixed attribute layout: no per-instance __dict__
+    __slots__ = (
+        'config', 'history', '_operation_strategy', '_operation_name', 'observers', 'undo_stack', 'redo_stack',
+        '_observer_updates', '_unflushed', '_rewrite_history', '_validated',
+        '_log_file_str', '_df_cache',
+        '_lock', '_save_lock', '_save_executor', '_pending_save', '_save_error'
+    )
+
     def __init__(self, config: Optional[CalculatorConfig] = None):
         """
         Initialize the Calculator with a configuration object.
@@ -67,22 +116,48 @@ class Calculator:
         self.config = config
         self.config.validate()
 
-        # make sure that log directory exists
-        os.makedirs(self.config.log_dir, exist_ok=True)
+        # logging is set up once, so its path is only needed here; the history paths
+        # are read from the config (which caches them) on every save and load
+        self._log_file_str = str(self.config.log_file.resolve())
 
         # set up logging system
         self._setup_logging()
 
         # initialize history and operation strategy
-        self.history: List[Calculation] = []  # List to store Calculation history
-        self.operation_strategy: Optional[Operation] = None  # Current operation strategy
-
-        # initialize observers
-        self.observers: List[HistoryObserver] = []
-
-        # initialize stacks for undo/redo functionality
-        self.undo_stack: List[CalculatorMemento] = []
-        self.redo_stack: List[CalculatorMemento] = []
+        self.history: Deque[Calculation] = deque(maxlen=self.config.max_history_size)  # Ring buffer of Calculation history
+        self.operation_strategy = None  # Current operation strategy
+
+        # initialize observers and their bound update methods; both are tuples,
+        # rebuilt on the rare add/remove and only iterated on every calculation
+        self.observers: Tuple[HistoryObserver, ...] = ()
+        self._observer_updates: Tuple[Callable[[Calculation], None], ...] = ()
+
+        # initialize stacks for undo/redo functionality, bounded so the oldest steps fall off
+        self.undo_stack: Deque[CalculatorMemento] = deque(maxlen=self.config.max_history_size)
+        self.redo_stack: Deque[CalculatorMemento] = deque(maxlen=self.config.max_history_size)
+
+        # calculations not yet written to the history file, and whether the file
+        # no longer matches the saved history and must be rewritten in full. The
+        # unsaved calculations are capped like the history: loading only keeps the
+        # newest max_history_size rows, so older unsaved ones would never be read back
+        self._unflushed: Deque[Calculation] = deque(maxlen=self.config.max_history_size)
+        self._rewrite_history = True
+
+        # validated operand strings, keyed with the input limit they were checked against
+        self._validated: Dict[Tuple[str, Decimal], Decimal] = {}
+
+        # DataFrame of the current history, dropped whenever the history changes
+        self._df_cache: Optional['pd.DataFrame'] = None
+
+        # background saving: the worker thread is started on the first scheduled save.
+        # _lock guards the history state and is held only briefly by saves, which
+        # snapshot under it; _save_lock lets one save at a time write the file.
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()
+        self._save_executor: Optional['ThreadPoolExecutor'] = None
+        self._pending_save: Optional['Future'] = None
+        # first background save failure not yet reported by flush()
+        self._save_error: Optional[Exception] = None
 
         # create required directories for history management
         self._setup_directories()
@@ -92,10 +167,10 @@ class Calculator:
             self.load_history()
         except Exception as e: 
             # log the error if history loading fails
-            logging.warning(f"Failed to load existing history: {e}")
+            logger.warning("Failed to load existing history: %s", e)
 
         # log the initialization of the calculator
-        logging.info("Calculator initialized with configuration")
+        logger.info("Calculator initialized with configuration")
 
     
     def _setup_logging(self):
@@ -108,20 +183,32 @@ class Calculator:
 
         try:
             # make sure that log directory exists
-            os.makedirs(self.config.log_dir, exist_ok=True)
-            log_file = self.config.log_file.resolve()
-
+            self._ensure_dir(self.config.log_dir)
             logging.basicConfig(
-                filename = str(log_file),
+                filename = self._log_file_str,
                 level = logging.INFO,
                 format = '%(asctime)s - %(levelname)s - %(message)s',
                 force= True  # Force reconfiguration of logging
             )
-            logging.info(f'logging initialized at {log_file}')
+            logger.info('logging initialized at %s', self._log_file_str)
         except Exception as e:
             print(f'Error setting up logging: {e}')
             raise
 
+    def _ensure_dir(self, path: Path) -> None:
+        """
+        Create a directory if it does not exist yet.
+
+        An existing directory costs a single stat instead of a mkdir of every
+        parent. Nothing is remembered between calls, so a directory deleted while
+        the process runs is created again by the next calculator.
+
+        Args:
+            path (Path): The directory to create.
+        """
+        if not path.is_dir():
+            path.mkdir(parents=True, exist_ok=True)
+
     def _setup_directories(self) -> None:
         """
         Create necessary directories.
@@ -129,21 +216,22 @@ class Calculator:
         Ensure that all necessary directories for history management exist.
 
         """
-        self.config.history_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(self.config.history_dir)
 
     def add_observer(self, observer: HistoryObserver) -> None:
         """
         Register a new observer to the calculator.
 
-        Adds an observer to the list of observers allowing it to receive updates
+        Adds an observer to the observers allowing it to receive updates
         when new calculations are performed.
 
         Args:
             observer (HistoryObserver): The observer to be added.
         
         """
-        self.observers.append(observer)
-        logging.info(f"Added observer: {observer.__class__.__name__}")
+        self.observers = self.observers + (observer,)
+        self._observer_updates = self._observer_updates + (observer.update,)
+        logger.info("Added observer: %s", observer.__class__.__name__)
 
 
     def remove_observer(self, observer: HistoryObserver) -> None:
@@ -152,26 +240,50 @@ class Calculator:
 
         Args:
             observer (HistoryObserver): The observer to be removed.
+
+        Raises:
+            ValueError: If the observer is not registered.
         
         """
-        self.observers.remove(observer)
-        logging.info(f"Removed observer: {observer.__class__.__name__}")
+        observers = list(self.observers)
+        observers.remove(observer)
+        self.observers = tuple(observers)
+        self._observer_updates = tuple(obs.update for obs in observers)
+        logger.info("Removed observer: %s", observer.__class__.__name__)
 
     def notify_observers(self, calculation: Calculation) -> None:
         """
         Notify all observers about a new calculation.
 
-        This method iterates through all registered observers and calls their
-        update method with the new calculation.
+        This method calls the update method of every registered observer with the
+        new calculation. The bound update methods are collected when observers are
+        added or removed, so no attribute lookup happens per notification.
 
         Args:
             calculation (Calculation): The Calculation instance to notify observers about.
         
         """
-        for observer in self.observers:
-            observer.update(calculation)
+        if not self._observer_updates:
+            return
+        for update in self._observer_updates:
+            update(calculation)
 
     
+    @property
+    def operation_strategy(self) -> Optional[Operation]:
+        """
+        The current operation strategy.
+
+        Assigning a strategy also stores its name, so perform_operation does not
+        convert the strategy to a string for every calculation.
+        """
+        return self._operation_strategy
+
+    @operation_strategy.setter
+    def operation_strategy(self, operation: Optional[Operation]) -> None:
+        self._operation_strategy = operation
+        self._operation_name = str(operation) if operation is not None else None
+
     def set_operation(self, operation: Operation) -> None:
         """
         Set the current operation strategy for the calculator.
@@ -186,9 +298,41 @@ class Calculator:
         """
 
         self.operation_strategy = operation
-        logging.info(f"Set operation: {operation}")
+        logger.info("Set operation: %s", operation)
 
     
+    def _validate_operand(self, value: Union[str, Number]) -> Decimal:
+        """
+        Validate an operand, reusing the result for operand strings seen before.
+
+        Strings are cached together with the configured maximum input value, so
+        changing the limit invalidates earlier entries. Once the cache is full the
+        least recently used entry is dropped. Other inputs are validated directly.
+
+        Args:
+            value (Union[str, Number]): The operand to validate.
+
+        Returns:
+            Decimal: The validated operand.
+
+        Raises:
+            ValidationError: If the operand is invalid or exceeds limits.
+        """
+        if not isinstance(value, str):
+            return InputValidator.validate_number(value, self.config)
+
+        key = (value, self.config.max_input_value)
+        validated = self._validated
+        number = validated.pop(key, None)
+        if number is None:
+            number = InputValidator.validate_number(value, self.config)
+            if len(validated) >= _VALIDATION_CACHE_SIZE:
+                # dicts keep insertion order, so the first key is the least recently used
+                del validated[next(iter(validated))]
+        # (re)insert the entry so it becomes the most recently used
+        validated[key] = number
+        return number
+
     def perform_operation(
             self,
             a: Union[str, Number],
@@ -211,161 +355,522 @@ class Calculator:
             ValidationError: If the input validation fails.
             OperationError: If the operation cannot be performed.
         """
-        if not self.operation_strategy:
+        # bind the attributes used below to locals once per call
+        strategy = self._operation_strategy
+        if not strategy:
             raise OperationError("No operation set. Please set an operation before performing calculations.")
         
         try:
-             # validate and convert inputs to Decimal
-            validate_a = InputValidator.validate_number(a, self.config)
-            validate_b = InputValidator.validate_number(b, self.config)
-
-            # excute the operation
-            result = self.operation_strategy.execute(validate_a, validate_b)
+            validate = self._validate_operand
+            max_size = self.config.max_history_size
+            history = self.history
+
+            # validate and convert inputs to Decimal
+            validate_a = validate(a)
+            validate_b = validate(b)
+
+            # excute the operation, reusing earlier results of expensive operations
+            operation_class = type(strategy)
+            if operation_class in _MEMOIZED_OPERATIONS:
+                result = _cached_execute(operation_class, validate_a, validate_b)
+            else:
+                result = strategy.execute(validate_a, validate_b)
 
             # Create a new Calculation object with the operation details
             calculation = Calculation(
-                operation=str(self.operation_strategy),
+                operation=self._operation_name,
                 operand1=validate_a,
                 operand2=validate_b,
             )
 
-            # save the current state to the undo stack 
-            self.undo_stack.append(CalculatorMemento(self.history.copy()))
+            with self._lock:
+                # rebuild the ring buffers if the configured max size changed
+                if history.maxlen != max_size:
+                    history = self._resize_history(max_size)
 
-            # clear the redo stack
-            self.redo_stack.clear()
+                # a full history drops its oldest calculation on append
+                evicted = history[0] if len(history) == max_size else None
 
-            # add the calculation to history
-            self.history.append(calculation)
+                # add the calculation to history
+                history.append(calculation)
+                self._unflushed.append(calculation)
+                self._df_cache = None
 
-            # ensure history does not exceed max size
-            if len(self.history) > self.config.max_history_size:
-                self.history.pop(0)
+                # record the change on the undo stack
+                self.undo_stack.append(CalculatorMemento(added=calculation, evicted=evicted))
+
+                # clear the redo stack
+                self.redo_stack.clear()
 
             # notify observers about the new calculation
-            self.notify_observers(calculation)
+            for update in self._observer_updates:
+                update(calculation)
 
             return result
         
         except ValidationError as e:
             # log and re-raise validation errors
-            logging.error(f"Validation error: {str(e)}")
+            logger.error("Validation error: %s", e)
             raise 
-        except Exception as e:
-            # log any other exceptions that occur during operation
-            logging.error(f"Operation failed: {str(e)}")
-            raise OperationError(f"Operation failed: {str(e)}")
+        except (OperationError, ArithmeticError, ValueError, TypeError) as e:
+            # wrap the errors a calculation can raise, keeping the original traceback;
+            # anything else is a bug and propagates unchanged
+            message = str(e)
+            logger.error("Operation failed: %s", message)
+            raise OperationError(f"Operation failed: {message}") from e
+
+    def try_perform_operation(
+            self,
+            a: Union[str, Number],
+            b: Union[str, Number]
+    ) -> Tuple[Optional[CalculationResult], Optional[str]]:
+        """
+        Perform a calculation, reporting expected failures as a value.
+
+        Behaves like perform_operation, but bad input and failed operations are
+        returned as an error message instead of raised, so callers such as the
+        REPL need no exception handling for them. Unexpected errors still
+        propagate.
+
+        Args:
+            a (Union[str, Number]): The first operand for the calculation.
+            b (Union[str, Number]): The second operand for the calculation.
+
+        Returns:
+            Tuple[Optional[CalculationResult], Optional[str]]: (result, None) on
+            success, or (None, error message) on failure.
+        """
+        try:
+            return self.perform_operation(a, b), None
+        except (ValidationError, OperationError) as e:
+            return None, str(e)
         
     
+    def perform_operations(
+            self,
+            pairs: Iterable[Tuple[Union[str, Number], Union[str, Number]]]
+    ) -> List[CalculationResult]:
+        """
+        Perform the current operation on a batch of operand pairs.
+
+        Gives the same results and history as calling perform_operation for each
+        pair, but every operand is validated and every result computed before the
+        history changes, so a failing pair leaves the history untouched. The
+        history and undo stack are then updated under a single lock, and observers
+        are notified once with the whole batch through update_batch. Each
+        calculation still gets its own memento, so undo steps back one
+        calculation at a time.
+
+        Args:
+            pairs (Iterable[Tuple[Union[str, Number], Union[str, Number]]]): Operand pairs to calculate.
+
+        Returns:
+            List[CalculationResult]: The results, in the order of the pairs.
+
+        Raises:
+            ValidationError: If the input validation fails for any pair.
+            OperationError: If the operation cannot be performed for any pair.
+        """
+        strategy = self._operation_strategy
+        if not strategy:
+            raise OperationError("No operation set. Please set an operation before performing calculations.")
+
+        try:
+            validate = self._validate_operand
+            operation_name = self._operation_name
+            operation_class = type(strategy)
+            if operation_class in _MEMOIZED_OPERATIONS:
+                execute = partial(_cached_execute, operation_class)
+            else:
+                execute = strategy.execute
+
+            # validate and calculate the whole batch before touching the history
+            results: List[CalculationResult] = []
+            calculations: List[Calculation] = []
+            for a, b in pairs:
+                validate_a = validate(a)
+                validate_b = validate(b)
+                results.append(execute(validate_a, validate_b))
+                calculations.append(Calculation(
+                    operation=operation_name,
+                    operand1=validate_a,
+                    operand2=validate_b,
+                ))
+
+        except ValidationError as e:
+            logger.error("Validation error: %s", e)
+            raise
+        except (OperationError, ArithmeticError, ValueError, TypeError) as e:
+            message = str(e)
+            logger.error("Operation failed: %s", message)
+            raise OperationError(f"Operation failed: {message}") from e
+
+        if not calculations:
+            return results
+
+        with self._lock:
+            max_size = self.config.max_history_size
+            history = self.history
+            if history.maxlen != max_size:
+                history = self._resize_history(max_size)
+
+            push_memento = self.undo_stack.append
+            for calculation in calculations:
+                evicted = history[0] if len(history) == max_size else None
+                history.append(calculation)
+                push_memento(CalculatorMemento(added=calculation, evicted=evicted))
+
+            self._unflushed.extend(calculations)
+            self._df_cache = None
+            self.redo_stack.clear()
+
+        for observer in self.observers:
+            observer.update_batch(calculations)
+
+        return results
+
+    def _resize_history(self, max_size: int) -> Deque[Calculation]:
+        """
+        Rebuild the history, undo/redo and unsaved-calculation ring buffers with a new maximum size.
+
+        Args:
+            max_size (int): The new maximum history size.
+
+        Returns:
+            Deque[Calculation]: The rebuilt history.
+        """
+        self.history = deque(self.history, maxlen=max_size)
+        self.undo_stack = deque(self.undo_stack, maxlen=max_size)
+        self.redo_stack = deque(self.redo_stack, maxlen=max_size)
+        self._unflushed = deque(self._unflushed, maxlen=max_size)
+        return self.history
+
+    @staticmethod
+    def _history_rows(calculations):
+        """
+        Convert calculations into CSV rows ordered like the history file columns.
+
+        Args:
+            calculations: Iterable of Calculation instances.
+
+        Returns:
+            Generator of (operation, operand1, operand2, result, timestamp) tuples of strings.
+        """
+        return (
+            (
+                calc.operation,
+                str(calc.operand1),
+                str(calc.operand2),
+                str(calc.result),
+                calc.timestamp.isoformat()
+            )
+            for calc in calculations
+        )
+
+    def _newest_rows(self, calculations: List[Calculation], max_bytes: int, min_rows: int) -> List[Tuple[str, ...]]:
+        """
+        Get the CSV rows of the newest calculations that fit in a byte budget.
+
+        Args:
+            calculations (List[Calculation]): Calculations to take rows from, oldest first.
+            max_bytes (int): Approximate size the rows may take in the file.
+            min_rows (int): Number of newest rows kept even if they exceed the budget.
+
+        Returns:
+            List[Tuple[str, ...]]: The rows, oldest first.
+        """
+        rows: List[Tuple[str, ...]] = []
+        size = 0
+        line_end = len(os.linesep)
+        for row in self._history_rows(reversed(calculations)):
+            # the fields, the commas between them and the line terminator
+            size += sum(map(len, row)) + len(row) - 1 + line_end
+            if size > max_bytes and len(rows) >= min_rows:
+                break
+            rows.append(row)
+        rows.reverse()
+        return rows
+
     def save_history(self) -> None:
         """
         Save the current calculation history to a CSV file.
 
-        Serializes the history of calculations to a CSV file for persistence storage.
-        Use pandas for easy data manipulation and storage.
+        Serializes the history of calculations to a CSV file for persistence storage
+        using the standard library csv module. When the configured history format is
+        'parquet', the history is written as a Parquet file through pandas instead;
+        Parquet files cannot be appended to, so each save rewrites that file.
+        Calculations added since the last save are appended to the file; the whole
+        history is rewritten only when the file no longer matches it
+        (first save, undo/redo or clear). When nothing changed since the last save,
+        the file is left untouched.
+
+        Rows dropped from the in-memory history by the size cap stay in the file,
+        since loading keeps only the newest max_history_size rows. Once the file
+        grows past max_history_bytes it is renamed to a .bak backup and a fresh
+        file is started with the newest calculations that fit in half that size,
+        so the next rotation is again half the limit of appends away.
 
         Raises:
             OperationError: If the history cannot be saved.
         
         """
 
-        try:
-            # ensure history directory exists
-            self.config.history_dir.mkdir(parents=True, exist_ok=True)
-
-            history_data = []
-            # prepare history data for saving
-            for calc in self.history:
-                history_data.append({
-                    'operation': str(calc.operation),
-                    'operand1': str(calc.operand1),
-                    'operand2': str(calc.operand2),
-                    'result': str(calc.result),
-                    'timestamp': calc.timestamp.isoformat()
-                })
-
-            if history_data:
-                # create a pandas DataFrame from the history data
-                df = pd.DataFrame(history_data)
-                # save the DataFrame to a CSV file
-                df.to_csv(self.config.history_file, index=False)
-                logging.info(f"History saved successfully to {self.config.history_file}")
+        # one save at a time writes the file; the history lock is only held while
+        # taking a snapshot, so calculations are not blocked behind the disk
+        with self._save_lock:
+            try:
+                # ensure history directory exists
+                self.config.history_dir.mkdir(parents=True, exist_ok=True)
+                history_file = str(self.config.history_file)
+
+                with self._lock:
+                    file_exists = os.path.exists(history_file)
+                    rewrite = self._rewrite_history or not file_exists
+                    if not rewrite and not self._unflushed:
+                        # the file already matches the history, nothing to write
+                        return
+
+                    # Calculations are immutable, so copies of the deques can be written
+                    # after the lock is released
+                    history_format = self.config.history_format
+                    frame = self._history_to_dataframe() if history_format == 'parquet' else None
+                    calculations = list(self.history)
+                    new_calculations = list(self._unflushed)
+                    self._unflushed.clear()
+                    self._rewrite_history = False
+
+                try:
+                    self._write_history(history_file, frame, calculations, new_calculations, rewrite)
+                except Exception:
+                    with self._lock:
+                        # the file may be incomplete; the next save rewrites it from the history
+                        self._rewrite_history = True
+                    raise
+
+            except Exception as e:
+                # log any errors that occur during history saving
+                logger.error("Failed to save history: %s", e)
+                raise OperationError(f"Failed to save history: {e}")
+
+    def _write_history(
+            self,
+            history_file: str,
+            frame: Optional['pd.DataFrame'],
+            calculations: List[Calculation],
+            new_calculations: List[Calculation],
+            rewrite: bool
+    ) -> None:
+        """
+        Write a snapshot of the history to the history file.
 
-            else:
-                # if history is empty, create an empty CSV file with headers
-                pd.DataFrame(columns=['operation', 'operand1', 'operand2', 'result', 'timestamp']).to_csv(
-                    self.config.history_file, index=False
-                )
-                logging.info("Empty history saved to CSV file.")
+        Args:
+            history_file (str): Path of the history file.
+            frame (Optional[pd.DataFrame]): The history as a DataFrame, for the parquet format.
+            calculations (List[Calculation]): The whole history, oldest first.
+            new_calculations (List[Calculation]): Calculations not yet in the file.
+            rewrite (bool): Whether the file must be rewritten instead of appended to.
+        """
+        if frame is not None:
+            frame.to_parquet(history_file, index=False)
+            logger.info("History saved successfully to %s", history_file)
+            return
+
+        rows = self._history_rows(calculations)
+        if not rewrite:
+            # append only the new calculations to the existing file
+            with open(history_file, 'a', newline='', encoding=self.config.default_encoding) as f:
+                csv.writer(f, lineterminator=os.linesep).writerows(self._history_rows(new_calculations))
+            logger.info("Appended %d calculations to %s", len(new_calculations), history_file)
+
+            if os.path.getsize(history_file) <= self.config.max_history_bytes:
+                return
+
+            # the file outgrew its limit: keep it as a backup and start a fresh one
+            # holding only the newest calculations, so it starts well under the limit
+            backup = history_file + '.bak'
+            os.replace(history_file, backup)
+            logger.info("Rotated history file to %s", backup)
+            rows = self._newest_rows(calculations, self.config.max_history_bytes // 2, len(new_calculations))
+
+        # rewrite the whole file: header first, then one row per calculation
+        with open(history_file, 'w', newline='', encoding=self.config.default_encoding) as f:
+            writer = csv.writer(f, lineterminator=os.linesep)
+            writer.writerow(_HISTORY_COLUMNS)
+            writer.writerows(rows)
+
+        if calculations:
+            logger.info("History saved successfully to %s", history_file)
+        else:
+            logger.info("Empty history saved to CSV file.")
+
+    def schedule_save(self) -> None:
+        """
+        Save the history on a background thread without waiting for the write.
+
+        Saves run one at a time on a single worker thread. A save that is still
+        queued when the next one is scheduled is cancelled, so a burst of
+        calculations is written to disk once. Pending saves are finished
+        before the interpreter exits; call flush() to wait for them sooner and
+        to find out whether any of them failed.
+        """
+        if self._pending_save is not None:
+            # a queued save has not started yet; the new one will cover it
+            self._pending_save.cancel()
+        if self._save_executor is None:
+            # imported here so starting the calculator does not pay for concurrent.futures
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='calculator-save')
+        self._pending_save = self._save_executor.submit(self._save_in_background)
 
+    def _save_in_background(self) -> None:
+        """
+        Run save_history on the save thread, keeping its failure for flush().
+
+        The failure is recorded inside the task rather than read from the Future,
+        so it is not lost when a newer save replaces this one, and it is in place
+        before flush() stops waiting.
+        """
+        try:
+            self.save_history()
         except Exception as e:
-            # log any errors that occur during history saving
-            logging.error(f"Failed to save history: {e}")
-            raise OperationError(f"Failed to save history: {e}")
-        
+            # save_history has already logged the failure
+            with self._lock:
+                if self._save_error is None:
+                    self._save_error = e
+
+    def flush(self) -> None:
+        """
+        Wait for the last scheduled save to finish.
+
+        Raises:
+            OperationError: If any background save since the last flush failed.
+                The first failure is raised.
+        """
+        pending, self._pending_save = self._pending_save, None
+        if pending is not None:
+            pending.result()
+        with self._lock:
+            error, self._save_error = self._save_error, None
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        """
+        Finish the scheduled saves and stop the background save thread.
+
+        The thread is stopped even if a save failed; a later schedule_save() starts
+        a new one.
+
+        Raises:
+            OperationError: If any background save since the last flush failed.
+        """
+        try:
+            self.flush()
+        finally:
+            executor, self._save_executor = self._save_executor, None
+            if executor is not None:
+                executor.shutdown(wait=True)
+
     def load_history(self) -> None:
         """
-        Load calculation history from a CSV file using pandas.
+        Load calculation history from a CSV file.
         
-        Reads the history from the configured CSV file and reconstructs the Calculation
-        instances, restoring them in the calculator's history.
+        Reads the history from the configured CSV file (or Parquet file, depending on
+        the configured history format) and reconstructs the Calculation instances,
+        restoring them in the calculator's history. Every field is read as text, so
+        operands are parsed exactly as they were saved.
         
         Raises:
             OperationError: If the history cannot be loaded or is invalid.
         """
 
-        try:
-            # check if history file exists
-            if self.config.history_file.exists():
-                # read the CSV file into a pandas DataFrame
-                df = pd.read_csv(self.config.history_file)
-
-                if not df.empty:
-                    # Deserialize each row into a Calculation object
-                    self.history = [
-                        Calculation.from_dict({
-                            'operation': row['operation'],
-                            'operand1': row['operand1'],
-                            'operand2': row['operand2'],
-                            'result': row['result'],
-                            'timestamp': row['timestamp']
-                        })
-                        for _, row in df.iterrows()
-                    ]
-                    logging.info(f"Loaded {len(self.history)} calculations from history file.")
+        with self._lock:
+            try:
+                history_file = str(self.config.history_file)
+                # check if history file exists
+                if os.path.exists(history_file):
+                    # read the CSV rows, keeping only the newest rows the history can hold
+                    # so older ones are never parsed
+                    max_size = self.config.max_history_size
+                    if os.path.getsize(history_file) == 0:
+                        # an empty file has no rows; skip the reader and, for parquet, pandas
+                        header, records = None, ()
+                    elif self.config.history_format == 'parquet':
+                        import pandas as pd
+
+                        df = pd.read_parquet(history_file).tail(max_size)
+                        header = list(df.columns)
+                        records = list(df.itertuples(index=False, name=None))
+                    else:
+                        with open(history_file, newline='', encoding=self.config.default_encoding) as f:
+                            reader = csv.reader(f)
+                            header = next(reader, None)
+                            records = deque(reader, maxlen=max_size)
+
+                    if records:
+                        # Deserialize each record into a Calculation object, keying the
+                        # row values by column name only for the retained rows
+                        self.history = deque(
+                            (Calculation.from_dict(dict(zip(header, row))) for row in records),
+                            maxlen=max_size
+                        )
+                        # mementos describe changes to the previous history, so they no longer apply
+                        self.undo_stack = deque(maxlen=max_size)
+                        self.redo_stack = deque(maxlen=max_size)
+                        # the file holds the loaded history, plus any older rows the size cap dropped
+                        self._unflushed = deque(maxlen=max_size)
+                        self._rewrite_history = False
+                        self._df_cache = None
+                        logger.info("Loaded %d calculations from history file.", len(self.history))
+                    else:
+                        logger.info("Loaded empty history file, no calculations found.")
                 else:
-                    logging.info("Loaded empty history file, no calculations found.") # pragma: no cover
-            else:
-                # if the history file does not exist, start with an empty history
-                logging.info("History file does not exist, starting with empty history.")
+                    # if the history file does not exist, start with an empty history
+                    logger.info("History file does not exist, starting with empty history.")
 
-        except Exception as e:
-            # log any errors that occur during history loading
-            logging.error(f"Failed to load history: {e}")
-            raise OperationError(f"Failed to load history: {e}")
+            except Exception as e:
+                # log any errors that occur during history loading
+                logger.error("Failed to load history: %s", e)
+                raise OperationError(f"Failed to load history: {e}")
         
 
-    def get_history_dataframe(self) -> pd.DataFrame:
+    def _history_to_dataframe(self) -> 'pd.DataFrame':
+        """
+        Build the history DataFrame, reusing it until the history changes.
+
+        The DataFrame is built from one list per column, which avoids creating a dict per row.
+        The cached frame is shared, so callers must not modify it.
+
+        Returns:
+            pd.DataFrame: A DataFrame containing the calculation history.
+        """
+        if self._df_cache is None:
+            # pandas is only needed here, so import it on first use to keep startup fast
+            import pandas as pd
+
+            calcs = self.history
+            self._df_cache = pd.DataFrame({
+                'operation': [calc.operation for calc in calcs],
+                'operand1': [str(calc.operand1) for calc in calcs],
+                'operand2': [str(calc.operand2) for calc in calcs],
+                'result': [str(calc.result) for calc in calcs],
+                'timestamp': [calc.timestamp.isoformat() for calc in calcs],
+            })
+        return self._df_cache
+
+    def get_history_dataframe(self) -> 'pd.DataFrame':
         """
         Get the current calculation history as a pandas DataFrame.
 
         Convert the list of Calculation instances into a pandas DataFrame for easy manipulation and analysis.
+        Repeated calls between history changes reuse the same serialized data.
 
         Returns:
             pd.DataFrame: A DataFrame containing the calculation history.
 
         """
-
-        history_data = []
-        for calc in self.history:
-            history_data.append({
-                'operation': str(calc.operation),
-                'operand1': str(calc.operand1),
-                'operand2': str(calc.operand2),
-                'result': str(calc.result),
-                'timestamp': calc.timestamp.isoformat()
-            })
-        return pd.DataFrame(history_data)
+        return self._history_to_dataframe().copy()
     
     def show_history(self) -> List[str]:
         """
@@ -376,19 +881,44 @@ class Calculator:
         Returns:
             List[str]: A list of formatted calculation history entries.
         """
-        return [
+        return list(self._formatted_history())
+
+    def format_history(self) -> str:
+        """
+        Get the formatted history of calculations as one string.
+
+        Joins the entries of show_history() with newlines without building the
+        intermediate list, for callers that print the whole history at once.
+
+        Returns:
+            str: One formatted calculation per line, or an empty string if there is no history.
+        """
+        return "\n".join(self._formatted_history())
+
+    def _formatted_history(self) -> Iterator[str]:
+        """
+        Yield each calculation in the history formatted for display.
+
+        Returns:
+            Iterator[str]: Lazily formatted calculation history entries.
+        """
+        return (
             f"{calc.operation}({calc.operand1}, {calc.operand2}) = {calc.result}"
             for calc in self.history
-        ]
+        )
     
     def clear_history(self) -> None:
         """
         
         """
-        self.history.clear()
-        self.undo_stack.clear()
-        self.redo_stack.clear()
-        logging.info("History cleared successfully.")
+        with self._lock:
+            self.history.clear()
+            self.undo_stack.clear()
+            self.redo_stack.clear()
+            self._unflushed.clear()
+            self._rewrite_history = True
+            self._df_cache = None
+            logger.info("History cleared successfully.")
 
     
     def undo(self) -> bool:
@@ -401,16 +931,21 @@ class Calculator:
             bool: True if the undo was successful, False if there are no actions to undo.
         
         """
-        if not self.undo_stack:
-            return False  # No mementos to undo
+        with self._lock:
+            if not self.undo_stack:
+                return False  # No mementos to undo
         
-        # Pop the last memento from the undo stack
-        memento = self.undo_stack.pop()
-        # Push the current state to the redo stack
-        self.redo_stack.append(CalculatorMemento(self.history.copy()))
-        # Restore the history from the memento
-        self.history = memento.history.copy()
-        return True  # Undo successful
+            # Pop the last memento from the undo stack
+            memento = self.undo_stack.pop()
+            # Revert the change: drop the added calculation and restore any evicted one
+            self.history.pop()
+            if memento.evicted is not None:
+                self.history.appendleft(memento.evicted)
+            # Push the memento to the redo stack
+            self.redo_stack.append(memento)
+            self._rewrite_history = True
+            self._df_cache = None
+            return True  # Undo successful
     
     def redo(self) -> bool:
         """
@@ -422,18 +957,16 @@ class Calculator:
             bool: True if the redo was successful, False if there are no actions to redo.
         
         """
-        if not self.redo_stack:
-            return False # No mementos to redo
+        with self._lock:
+            if not self.redo_stack:
+                return False # No mementos to redo
         
-        # Pop the last memento from the redo stack
-        memento = self.redo_stack.pop()
-        # Push the current state to the undo stack
-        self.undo_stack.append(CalculatorMemento(self.history.copy()))
-        # Restore the history from the memento
-        self.history = memento.history.copy()
-        return True  # Redo successful
-
-        
-
-
-
+            # Pop the last memento from the redo stack
+            memento = self.redo_stack.pop()
+            # Re-apply the change: appending to the full history evicts the oldest one again
+            self.history.append(memento.added)
+            # Push the memento back to the undo stack
+            self.undo_stack.append(memento)
+            self._rewrite_history = True
+            self._df_cache = None
+            return True  # Redo successful
@@ -2,8 +2,8 @@
 # Calculator Config    #
 ########################
 
-from dataclasses import dataclass
 from decimal import Decimal
+import importlib.util
 from numbers import Number
 from pathlib import Path
 import os
@@ -26,19 +26,38 @@ def get_project_root() -> Path:
     return current_file.parent.parent
 
 
-@dataclass
+def parquet_engine_available() -> bool:
+    """
+    Check whether pandas has an engine for reading and writing Parquet files.
+
+    The engines are looked up without being imported.
+    """
+    return any(importlib.util.find_spec(name) is not None for name in ('pyarrow', 'fastparquet'))
+
+
 class CalculatorConfig:
     """
     Configuration for the calculator application.
     
     This class holds configuration settings for the calculator, including
     the precision for decimal operations, directory paths, history size, 
-    auto-save preference, maximum input values, and default encoding.
+    auto-save preference, maximum input values, default encoding, the
+    size at which the history file is rotated, and the history file format.
     
     Configurations are loaded from environment variables or by passing
-    parameters directly to the class constructor.
+    parameters directly to the class constructor. Directory and file paths
+    are resolved on first access and cached until invalidate_paths() is called.
     
     """
+
+    # fixed attribute layout: no per-instance __dict__; the _-prefixed slots
+    # hold the cached directory and file paths
+    __slots__ = (
+        'base_dir', 'max_history_size', 'auto_save', 'precision', 'max_input_value',
+        'default_encoding', 'max_history_bytes', '_history_format',
+        '_log_dir', '_history_dir', '_log_file', '_history_file'
+    )
+
     def __init__(
              self,
         base_dir: Optional[Path] = None,
@@ -47,6 +66,8 @@ class CalculatorConfig:
         precision: Optional[int] = None,
         max_input_value: Optional[Number] = None,
         default_encoding: Optional[str] = None,
+        max_history_bytes: Optional[int] = None,
+        history_format: Optional[str] = None,
     ):
         
         """
@@ -59,40 +80,58 @@ class CalculatorConfig:
             precision (int, optional): Decimal precision for calculations.
             max_input_value (Number, optional): Maximum value for input operands.
             default_encoding (str, optional): Default encoding for string operations.
+            max_history_bytes (int, optional): Size in bytes above which the history file is rotated.
+            history_format (str, optional): History file format, 'csv' or 'parquet'.
         """
 
+        # Explicit arguments are checked with "is None" so that falsy values such as
+        # precision=0 or auto_save=False are kept, and the environment is only read
+        # for settings that were not passed in.
+
         # set base directory to project root by default
-        project_root = get_project_root()
-        self.base_dir = base_dir or Path(
-            os.getenv('CALCULATOR_BASE_DIR', str(project_root))
+        self.base_dir = base_dir if base_dir is not None else Path(
+            os.getenv('CALCULATOR_BASE_DIR', str(get_project_root()))
         ).resolve()
 
 
         # set max history size to 1000 by default
-        self.max_history_size = max_history_size or int(
+        self.max_history_size = max_history_size if max_history_size is not None else int(
             os.getenv('CALCULATOR_MAX_HISTORY_SIZE', 1000)
         )
 
         # set auto save to True by default
-        self.auto_save = auto_save if auto_save is not None else bool(
-            os.getenv('CALCULATOR_AUTO_SAVE', True)
+        self.auto_save = auto_save if auto_save is not None else (
+            os.getenv('CALCULATOR_AUTO_SAVE', 'true').lower() in ('true', '1', 'yes')
         )
 
         # set precision to 10 by default
-        self.precision = precision or int(
+        self.precision = precision if precision is not None else int(
             os.getenv('CALCULATOR_PRECISION', 10)
         )
 
         # set max input value to 1000000 by default
-        self.max_input_value = max_input_value or Decimal(
+        self.max_input_value = max_input_value if max_input_value is not None else Decimal(
             os.getenv('CALCULATOR_MAX_INPUT_VALUE', 1000000)
         )
     
         # set default encoding to utf-8 by default
-        self.default_encoding = default_encoding or os.getenv(
+        self.default_encoding = default_encoding if default_encoding is not None else os.getenv(
             'CALCULATOR_DEFAULT_ENCODING', 'utf-8'
         )
 
+        # rotate the history file once it grows past 1 MiB by default
+        self.max_history_bytes = max_history_bytes if max_history_bytes is not None else int(
+            os.getenv('CALCULATOR_MAX_HISTORY_BYTES', 1024 * 1024)
+        )
+
+        # set history format to csv by default; parquet requires pyarrow or fastparquet
+        self.history_format = (history_format if history_format is not None else os.getenv(
+            'CALCULATOR_HISTORY_FORMAT', 'csv'
+        )).lower()
+
+        # paths are resolved on first access
+        self.invalidate_paths()
+
     @property
     def log_dir(self) -> Path:
         """
@@ -103,9 +142,11 @@ class CalculatorConfig:
         Returns:
             Path: The path to the log directory. 
         """
-        return Path(
-            os.getenv('CALCULATOR_LOG_DIR', str(self.base_dir / 'logs'))
-        ).resolve()
+        if self._log_dir is None:
+            self._log_dir = Path(
+                os.getenv('CALCULATOR_LOG_DIR', str(self.base_dir / 'logs'))
+            ).resolve()
+        return self._log_dir
     
 
     @property
@@ -118,9 +159,11 @@ class CalculatorConfig:
         Returns:
             Path: The path to the history directory.
         """
-        return Path(
-            os.getenv('CALCULATOR_HISTORY_DIR', str(self.base_dir / 'history'))
-        ).resolve()
+        if self._history_dir is None:
+            self._history_dir = Path(
+                os.getenv('CALCULATOR_HISTORY_DIR', str(self.base_dir / 'history'))
+            ).resolve()
+        return self._history_dir
     
     @property
     def log_file(self) -> Path:
@@ -132,24 +175,66 @@ class CalculatorConfig:
         Returns:
             Path: The path to the log file.
         """
-        return Path(
-            os.getenv('CALCULATOR_LOG_FILE', str(self.log_dir / 'calculator.log'))
-        ).resolve()
+        if self._log_file is None:
+            self._log_file = Path(
+                os.getenv('CALCULATOR_LOG_FILE', str(self.log_dir / 'calculator.log'))
+            ).resolve()
+        return self._log_file
     
     @property
     def history_file(self) -> Path:
         """
         Get the history file path.
         
-        Determines the file path for the calculation history file.
+        Determines the file path for the calculation history file. The default
+        file name takes its extension from the history format.
 
         Returns:
             Path: The path to the history file.
         """
-        return Path(
-            os.getenv('CALCULATOR_HISTORY_FILE', str(self.history_dir / 'calculator_history.csv'))
-        ).resolve()
+        if self._history_file is None:
+            self._history_file = Path(
+                os.getenv('CALCULATOR_HISTORY_FILE', str(self.history_dir / f'calculator_history.{self.history_format}'))
+            ).resolve()
+        return self._history_file
     
+    @property
+    def history_format(self) -> str:
+        """
+        Get the history file format.
+
+        Returns:
+            str: 'csv' or 'parquet'.
+        """
+        return self._history_format
+
+    @history_format.setter
+    def history_format(self, value: str) -> None:
+        """
+        Set the history file format.
+
+        The default history file name depends on the format, so the cached history
+        file path is resolved again on next access.
+
+        Args:
+            value (str): The new history file format.
+        """
+        self._history_format = value
+        self._history_file = None
+
+    def invalidate_paths(self) -> None:
+        """
+        Clear the cached directory and file paths.
+
+        The path properties are computed once per config and then cached. Call this
+        after changing base_dir or the path environment variables so they are
+        resolved again on next access.
+        """
+        self._log_dir = None
+        self._history_dir = None
+        self._log_file = None
+        self._history_file = None
+
     def validate(self):
         """
         Validate the configuration settings.
@@ -167,5 +252,14 @@ class CalculatorConfig:
         
         if self.max_input_value <= 0:
             raise ConfigurationError("Maximum input value must be a positive number.")
+
+        if self.max_history_bytes <= 0:
+            raise ConfigurationError("Maximum history file size must be a positive integer.")
+
+        if self.history_format not in ('csv', 'parquet'):
+            raise ConfigurationError("History format must be 'csv' or 'parquet'.")
+
+        if self.history_format == 'parquet' and not parquet_engine_available():
+            raise ConfigurationError("History format 'parquet' requires pyarrow or fastparquet to be installed.")
         
     
\ No newline at end of file
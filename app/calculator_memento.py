@@ -7,7 +7,10 @@ Calculator Memento
 
 In this module, we define the `CalculatorMemento` class, which is used to store the state of the calculator.
 This class is part of the memento design pattern, allowing us to store calculator states
-for undo/redo functionality.
+for undo/redo functionality. Rather than snapshotting the whole history, each memento
+records only the change made by one calculation, so undo/redo costs O(1) per step.
+Mementos share their Calculation objects with the history instead of copying them;
+Calculation is immutable, so the shared references can never diverge.
 
 key features:
 - Memento design pattern: Captures and stores the state of the calculator without exposing its internal structure.
@@ -16,21 +19,22 @@ key features:
 
 from dataclasses import dataclass, field
 import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional
 
 from app.calculation import Calculation
 
 
-@dataclass
+@dataclass(slots=True)
 class CalculatorMemento:
     """
     Stores calculator state for undo/redo functionality.
     
-    The Memento patterns allows the calculator to save its current state (history of calculations)
-    so that it can be restored later. This is useful for implementing undo/redo features.
+    The Memento patterns allows the calculator to save the change made to its state (history of calculations)
+    so that it can be reverted or re-applied later. This is useful for implementing undo/redo features.
     """
 
-    history: List[Calculation] # List of Calculation objects representing the history of calculations.
+    added: Calculation # Calculation appended to the history.
+    evicted: Optional[Calculation] = None # Oldest calculation dropped by the history size cap, if any.
     timestamp: datetime.datetime = field(default_factory=datetime.datetime.now)  # Timestamp of when the memento was created.
     
 
@@ -45,9 +49,10 @@ class CalculatorMemento:
             Dict[str, Any]: A dictionary containing the serialized state of the memento.
         """
         return {
-            'history': [calc.to_dict() for calc in self.history],
+            'added': self.added.to_dict(),
+            'evicted': self.evicted.to_dict() if self.evicted is not None else None,
             'timestamp': self.timestamp.isoformat()
-        } # pragma: no cover
+        }
         
     
     @classmethod
@@ -56,7 +61,7 @@ class CalculatorMemento:
         Create a calculator memento from a dictionary.
         
         This class method deserializes a dictionary to recreate a CalculatorMemento instance,
-        restoring the history of calculations and the timestamp.
+        restoring the recorded calculations and the timestamp.
         
         
         Args:
@@ -67,9 +72,10 @@ class CalculatorMemento:
             CalculatorMemento: A new instance of CalculatorMemento with the state restored from the dictionary.
         """
         return cls(
-            history=[Calculation.from_dict(calc) for calc in data['history']],
+            added=Calculation.from_dict(data['added']),
+            evicted=Calculation.from_dict(data['evicted']) if data.get('evicted') else None,
             timestamp=datetime.datetime.fromisoformat(data['timestamp'])
-        ) # pragma: no cover
+        )
     
 
 
@@ -9,25 +9,194 @@ redo functionality.
 
 """
 
-from calendar import c
 from decimal import Decimal
 import logging
+from typing import Callable, Dict, Optional
 
 from colorama import Fore, Style, init as colorama_init
 from app.calculator import Calculator
-from app.exceptions import OperationError, ValidationError
+from app.exceptions import OperationError
 from app.history import AutoSaverObserver, LoggingObserver
 from app.operations import OperationFactory
 
 colorama_init(autoreset=True)  # Initialize colorama for colored output
 
 
+# Colour codes and fixed prompts, looked up and formatted once at import
+_GREEN = Fore.GREEN
+_RED = Fore.RED
+_RESET = Style.RESET_ALL
+_COMMAND_PROMPT = f"{_GREEN}Enter command: {_RESET}"
+_OPERANDS_MESSAGE = f"{_GREEN}\n Enter number (or cancel to abort):{_RESET}"
+_FIRST_NUMBER_PROMPT = f"{_GREEN}First number: {_RESET}"
+_SECOND_NUMBER_PROMPT = f"{_GREEN}Second number: {_RESET}"
+_CANCELLED_MESSAGE = f"{_GREEN}Operation cancelled.{_RESET}"
+
+
+# Help text, built once and printed with a single write
+_HELP_TEXT = "\n".join([
+    f"{_GREEN}\nAvailable commands:",
+    "  add, subtract, multiply, divide, power, root, modulus, integerdivision, percentage, absolutedifference",
+    "  history - Show calculation history",
+    "  undo - Undo the last operation",
+    "  redo - Redo the last undone operation",
+    "  clear - Clear the history",
+    "  save - Save the current history to a file",
+    "  load - Load history from a file",
+    f"  exit - Exit the calculator REPL{_RESET}",
+])
+
+
+def _show_help(calc: Calculator) -> None:
+    """Display the available commands."""
+    print(_HELP_TEXT)
+
+
+def _close(calc: Calculator) -> None:
+    """Finish auto-saves still running in the background and report one that failed."""
+    try:
+        calc.close()
+    except OperationError as e:
+        print(f"{_RED}Warning: Could not save history before exiting: {e}{_RESET}")
+
+
+def _exit(calc: Calculator) -> bool:
+    """Save the history and end the REPL. Returns True to stop the loop."""
+    # Finish background auto-saves. A failed one is not reported on its own: its
+    # calculations are still unsaved, so the save below retries them and reports
+    # the outcome once.
+    try:
+        calc.close()
+    except OperationError:
+        pass
+    # Attempt to save history before exiting
+    try:
+        calc.save_history()
+        print(f"{_GREEN}History saved successfully.{_RESET}")
+    except OperationError as e:
+        print(f"{_RED}Warning: Could not save history before exiting: {e}{_RESET}")
+    print(f"{_GREEN}Exiting calculator REPL. Goodbye!{_RESET}")
+    return True
+
+
+def _show_history(calc: Calculator) -> None:
+    """Show the calculation history."""
+    history = calc.show_history()
+    if not history:
+        print(f"{_GREEN}No calculations performed yet.{_RESET}")
+    else:
+        print(f"{_GREEN}\nCalculation History:{_RESET}")
+        # print the numbered entries with one write instead of one per line
+        print("\n".join(
+            f"{_GREEN}{idx}. {entry}{_RESET}"
+            for idx, entry in enumerate(history, start=1)
+        ))
+
+
+def _clear_history(calc: Calculator) -> None:
+    """Clear the calculation history."""
+    calc.clear_history()
+    print(f"{_GREEN}History cleared.{_RESET}")
+
+
+def _undo(calc: Calculator) -> None:
+    """Undo the last operation."""
+    if calc.undo():
+        print(f"{_GREEN}Last operation undone.{_RESET}")
+    else:
+        print(f"{_GREEN}No operations to undo.{_RESET}")
+
+
+def _redo(calc: Calculator) -> None:
+    """Redo the last undone operation."""
+    if calc.redo():
+        print(f"{_GREEN}Last operation redone.{_RESET}")
+    else:
+        print(f"{_GREEN}No operations to redo.{_RESET}")
+
+
+def _load_history(calc: Calculator) -> None:
+    """Load history from a file."""
+    try:
+        calc.load_history()
+        print(f"{_GREEN}History loaded successfully.{_RESET}")
+    except Exception as e:
+        print(f"{_RED}Error loading history: {e}{_RESET}")
+
+
+def _save_history(calc: Calculator) -> None:
+    """Save the current history to a file."""
+    try:
+        calc.save_history()
+        print(f"{_GREEN}History saved successfully.{_RESET}")
+    except Exception as e:
+        print(f"{_RED}Error saving history: {e}{_RESET}")
+
+
+def _run_operation(calc: Calculator, command: str) -> None:
+    """Prompt for two operands and perform the arithmetic operation named by command."""
+    print(_OPERANDS_MESSAGE)
+    a = input(_FIRST_NUMBER_PROMPT)
+    if a.lower() == 'cancel':
+        print(_CANCELLED_MESSAGE)
+        return
+    b = input(_SECOND_NUMBER_PROMPT)
+    if b.lower() == 'cancel':
+        print(_CANCELLED_MESSAGE)
+        return
+
+    try:
+        # Get the operation instance; the factory reuses one per command
+        operation = OperationFactory.create_operation(command)
+        calc.set_operation(operation)
+
+        # Perform the calculation; bad input comes back as an error message
+        result, error = calc.try_perform_operation(a, b)
+    except Exception as e:
+        # Handle any other unexpected errors
+        print(f"{_RED}An unexpected error occurred: {e}{_RESET}")
+        return
+
+    if error is not None:
+        print(f"{_RED}Error: {error}{_RESET}")
+        return
+
+    # Normalize the result to Decimal for consistent output
+    if isinstance(result, Decimal):
+        result = result.normalize()
+
+    print(f"{_GREEN}\nResult: {result}{_RESET}")
+
+
+# Commands mapped to their handlers, built once at import. A handler returns True to end the REPL.
+_COMMAND_HANDLERS: Dict[str, Callable[[Calculator], Optional[bool]]] = {
+    'help': _show_help,
+    'exit': _exit,
+    'history': _show_history,
+    'clear': _clear_history,
+    'undo': _undo,
+    'redo': _redo,
+    'load': _load_history,
+    'save': _save_history,
+}
+
+# Commands that perform an arithmetic operation
+_ARITHMETIC_COMMANDS = frozenset({
+    'add', 'subtract', 'multiply', 'divide', 'power', 'root',
+    'modulus', 'integerdivision', 'percentage', 'absolutedifference',
+})
+
+# Every command the REPL accepts, in its normalized form
+_KNOWN_COMMANDS = _ARITHMETIC_COMMANDS | frozenset(_COMMAND_HANDLERS)
+
+
 def start_calculator_repl():
     """
     Start the calculator REPL (Read-Eval-Print Loop).
 
     This function initializes the calculator, registers observers for logging and auto-saving history,
     and provides an interactive command-line interface for performing calculations.
+    Commands are dispatched through a lookup table rather than a chain of comparisons.
 
     """
 
@@ -39,137 +208,43 @@ def start_calculator_repl():
         calc.add_observer(LoggingObserver())
         calc.add_observer(AutoSaverObserver(calc))
 
-        print(f"{Fore.GREEN}Calculator REPL started. Type 'help' for available commands.{Style.RESET_ALL}")
+        print(f"{_GREEN}Calculator REPL started. Type 'help' for available commands.{_RESET}")
 
         while True:
             try:
                 # prompt user for a command
-                command = input(f"{Fore.GREEN}Enter command: {Style.RESET_ALL}").lower().strip()
-
-                if command == "help":
-                    # Display the available commands
-                    print(f"{Fore.GREEN}\nAvailable commands:")
-                    print("  add, subtract, multiply, divide, power, root, modulus, integerdivision, percentage, absolutedifference")
-                    print("  history - Show calculation history")
-                    print("  undo - Undo the last operation")
-                    print("  redo - Redo the last undone operation")
-                    print("  clear - Clear the history")
-                    print("  save - Save the current history to a file")
-                    print("  load - Load history from a file")
-                    print(f"  exit - Exit the calculator REPL{Style.RESET_ALL}")
-                    continue
-
-                if command == "exit":
-                    # Attempt to save history before exiting
-                    try:
-                        calc.save_history()
-                        print(f"{Fore.GREEN}History saved successfully.{Style.RESET_ALL}")
-                    except OperationError as e:
-                        print(f"{Fore.RED}Warning: Could not save history before exiting: {e}{Style.RESET_ALL}")
-                    print(f"{Fore.GREEN}Exiting calculator REPL. Goodbye!{Style.RESET_ALL}")
-                    break
-                if command == "history":
-                    # Show the calculation history
-                    history = calc.show_history()
-                    if not history:
-                        print(f"{Fore.GREEN}No calculations performed yet.{Style.RESET_ALL}")
-                    else:
-                        print(f"{Fore.GREEN}\nCalculation History:{Style.RESET_ALL}")
-                        for idx, entry in enumerate(history, start=1):
-                            print(f"{Fore.GREEN}{idx}. {entry}{Style.RESET_ALL}")
-                    continue
-
-                if command == "clear":
-                    # Clear the calculation history
-                    calc.clear_history()
-                    print(f"{Fore.GREEN}History cleared.{Style.RESET_ALL}")
-                    continue
-
-                if command == "undo":
-                    # Undo the last operation
-                    if calc.undo():
-                        print(f"{Fore.GREEN}Last operation undone.{Style.RESET_ALL}")
-                    else:
-                        print(f"{Fore.GREEN}No operations to undo.{Style.RESET_ALL}")
-                    continue
-
-                if command == "redo":
-                    # Redo the last undone operation
-                    if calc.redo():
-                        print(f"{Fore.GREEN}Last operation redone.{Style.RESET_ALL}")
-                    else:
-                        print(f"{Fore.GREEN}No operations to redo.{Style.RESET_ALL}")
-                    continue
-
-                if command == "load":
-                    # Load history from a file
-                    try:
-                        calc.load_history()
-                        print(f"{Fore.GREEN}History loaded successfully.{Style.RESET_ALL}")
-                    except Exception as e:
-                        print(f"{Fore.RED}Error loading history: {e}{Style.RESET_ALL}")
-                    continue
-
-                if command == "save":
-                    # Save the current history to a file
-                    try:
-                        calc.save_history()
-                        print(f"{Fore.GREEN}History saved successfully.{Style.RESET_ALL}")
-                    except Exception as e:
-                        print(f"{Fore.RED}Error saving history: {e}{Style.RESET_ALL}")
-                    continue
-
-                if command in['add', 'subtract', 'multiply', 'divide', 'power', 'root', 'modulus', 'integerdivision', 'percentage', 'absolutedifference']:
+                command = input(_COMMAND_PROMPT)
+                # commands are usually typed exactly; only normalize the ones that are not
+                if command not in _KNOWN_COMMANDS:
+                    command = command.lower().strip()
+
+                handler = _COMMAND_HANDLERS.get(command)
+                if handler is not None:
+                    if handler(calc):
+                        break
+                elif command in _ARITHMETIC_COMMANDS:
                     # Perform a calculation based on the command
-                    try:
-                        print(f"{Fore.GREEN}\n Enter number (or cancel to abort):{Style.RESET_ALL}")
-                        a = input(f"{Fore.GREEN}First number: {Style.RESET_ALL}")
-                        if a.lower() == 'cancel':
-                            print(f"{Fore.GREEN}Operation cancelled.{Style.RESET_ALL}")
-                            continue
-                        b = input(f"{Fore.GREEN}Second number: {Style.RESET_ALL}")
-                        if b.lower() == 'cancel':
-                            print(f"{Fore.GREEN}Operation cancelled.{Style.RESET_ALL}")
-                            continue
-
-                        # Create appropriate operation instance using the factory pattern
-                        operation = OperationFactory.create_operation(command)
-                        calc.set_operation(operation)
-
-                        # Perform the calculation
-                        result = calc.perform_operation(a, b)
-
-                        # Normalize the result to Decimal for consistent output
-                        if isinstance(result, Decimal):
-                            result = result.normalize()
-                        
-                        print(f"{Fore.GREEN}\nResult: {result}{Style.RESET_ALL}")
-
-                    except (OperationError, ValidationError) as e:
-                        # Handle specific operation errors
-                        print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
-                    except Exception as e:
-                        # Handle any other unexpected errors
-                        print(f"{Fore.RED}An unexpected error occurred: {e}{Style.RESET_ALL}")
-                    continue
-                # Handle unknown commands
-                print(f"{Fore.GREEN}Unknown command: '{command}'. Type 'help' for available commands.{Style.RESET_ALL}")
+                    _run_operation(calc, command)
+                else:
+                    # Handle unknown commands
+                    print(f"{_GREEN}Unknown command: '{command}'. Type 'help' for available commands.{_RESET}")
 
             except KeyboardInterrupt:
                 # Handle Ctrl+C gracefully
-                print(f"{Fore.GREEN}\nOperation cancelled by user.{Style.RESET_ALL}")
+                print(f"{_GREEN}\nOperation cancelled by user.{_RESET}")
                 continue
             except EOFError:
                 # Handle EOF (Ctrl+D) gracefully
-                print(f"{Fore.GREEN}\nInput terminated by user. Exiting REPL....{Style.RESET_ALL}")
+                print(f"{_GREEN}\nInput terminated by user. Exiting REPL....{_RESET}")
+                _close(calc)
                 break
             except Exception as e:
                 # Catch any other unexpected errors
-                print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+                print(f"{_RED}Error: {e}{_RESET}")
                 continue
     except Exception as e:
         # Handle any initialization errors
-        print(f"{Fore.RED}Failed to start calculator REPL: {e}{Style.RESET_ALL}")
+        print(f"{_RED}Failed to start calculator REPL: {e}{_RESET}")
         logging.error(f"Failed to start calculator REPL: {e}")
         raise 
 
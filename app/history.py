@@ -17,7 +17,7 @@ The module contains:
 
 from abc import ABC, abstractmethod
 import logging
-from typing import Any
+from typing import Any, Sequence
 from app.calculation import Calculation
 
 
@@ -43,6 +43,19 @@ class HistoryObserver(ABC):
         """
         pass # pragma: no cover
 
+    def update_batch(self, calculations: Sequence[Calculation]) -> None:
+        """
+        Handle a batch of calculations performed together.
+
+        By default each calculation is passed to `update` in order; observers
+        that can handle the batch at once should override this.
+
+        Args:
+            calculations (Sequence[Calculation]): The calculations that were performed.
+        """
+        for calculation in calculations:
+            self.update(calculation)
+
 
 class LoggingObserver(HistoryObserver):
     """
@@ -62,10 +75,13 @@ class LoggingObserver(HistoryObserver):
         """
         if calculation is None:
             raise AttributeError("Calculation cannot be None")
+        # %-style arguments are only formatted if an INFO record is actually emitted
         logging.info(
-            f"Calculation performed: {calculation.operation.lower()} "
-            f"({calculation.operand1}, {calculation.operand2}) = "
-            f"{calculation.result}"
+            "Calculation performed: %s (%s, %s) = %s",
+            calculation.operation.lower(),
+            calculation.operand1,
+            calculation.operand2,
+            calculation.result,
         )
     
 
@@ -74,7 +90,11 @@ class AutoSaverObserver(HistoryObserver):
     Observer that automatically saves Calculation history.
     
     Implements the Observer pattern by looking for new Calculation events
-    and saving the history to a file.
+    and saving the history to a file. When the calculator supports background
+    saving (schedule_save), the save is handed to its save thread so the
+    calculation does not wait for the disk, and saves requested in quick
+    succession are coalesced into one write. The auto-save setting is read
+    once; call refresh_config() after changing it.
 
     """
 
@@ -93,6 +113,18 @@ class AutoSaverObserver(HistoryObserver):
         if not hasattr(calculator, 'config') or not hasattr(calculator, 'save_history'):
             raise TypeError("Calculator must have 'config' and 'save_history' attributes")
         self.calculator = calculator
+        self.refresh_config()
+
+    def refresh_config(self) -> None:
+        """
+        Re-read the calculator's auto-save setting.
+
+        The setting and the save method are looked up here instead of on every
+        calculation. Saving happens in the background when the calculator
+        supports it (schedule_save), otherwise through save_history.
+        """
+        self._auto_save = bool(self.calculator.config.auto_save)
+        self._save = getattr(self.calculator, 'schedule_save', None) or self.calculator.save_history
 
     def update(self, calculation: Calculation) -> None:
         """
@@ -107,10 +139,17 @@ class AutoSaverObserver(HistoryObserver):
         """
         if calculation is None:
             raise AttributeError("Calculation cannot be None")
-        if self.calculator.config.auto_save:
-            self.calculator.save_history()
+        if self._auto_save:
+            self._save()
             logging.info("History auto-saved after new calculation.")
-    
-
 
+    def update_batch(self, calculations: Sequence[Calculation]) -> None:
+        """
+        Trigger a single auto-save for a batch of Calculations.
 
+        Args:
+            calculations (Sequence[Calculation]): The Calculations that were performed.
+        """
+        if self._auto_save:
+            self._save()
+            logging.info("History auto-saved after %d new calculations.", len(calculations))
@@ -26,6 +26,7 @@ we will use the factory pattern to create instances of these operations.
 from abc import ABC, abstractmethod
 from typing import Dict
 from decimal import Decimal
+from app.calculation import _power, _root
 from app.exceptions import ValidationError
 
 
@@ -34,6 +35,9 @@ class Operation(ABC):
     Abstract base class for operations.
     """
 
+    # no instance state; one shared instance per operation is created by the factory
+    __slots__ = ()
+
     @abstractmethod
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
@@ -56,6 +60,8 @@ class Operation(ABC):
 
         This method checks if the operands are valid for the operation.
         It can be overridden by subclasses to implement specific validation rules.
+        The base implementation accepts all operands, so overrides do not need
+        to call it.
 
         Args:
             a (Decimal): First operand.
@@ -85,6 +91,9 @@ class Addition(Operation):
     
     Performs addition of two decimal numbers.
     """
+
+    __slots__ = ()
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
         Execute the addition operation.
@@ -104,6 +113,8 @@ class Subtraction(Operation):
     Performs subtraction of two decimal numbers.
     """
 
+    __slots__ = ()
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
         Execute the subtraction operation.
@@ -125,6 +136,8 @@ class Multiplication(Operation):
     Performs multiplication of two decimal numbers.
     """
 
+    __slots__ = ()
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
         Execute the multiplication operation.
@@ -144,6 +157,8 @@ class Division(Operation):
     Performs division of two decimal numbers.
     """
 
+    __slots__ = ()
+
     def validate_operands(self, a, b):
         """
         Validate the operands for the division operation.
@@ -154,7 +169,6 @@ class Division(Operation):
         :param b: Second number
         :raises ValidationError: If the second operand is zero.
         """
-        super().validate_operands(a, b)
         if b == 0:
             raise ValidationError("Division by zero is not allowed.")
         
@@ -178,6 +192,8 @@ class Power(Operation):
     Performs exponentiation of a base number raised to a power.
     """
 
+    __slots__ = ()
+
     def validate_operands(self, a, b):
         """
         Validate the operands for the power operation.
@@ -189,8 +205,6 @@ class Power(Operation):
         :param b: Exponent
         :raises ValidationError: If the exponent is negative.
         """
-        super().validate_operands(a, b)
-
         if b < 0:
             raise ValidationError("Negative exponent is not allowed for this operation.")
         
@@ -204,7 +218,9 @@ class Power(Operation):
         :return: Result of the power operation
         """
         self.validate_operands(a, b)
-        return Decimal(pow(float(a), float(b)))
+        # same kernel as Calculation: exact Decimal for integral exponents,
+        # memoized float math for fractional ones
+        return _power(a, b)
     
 class Root(Operation):
     """Class for root operation.
@@ -212,6 +228,8 @@ class Root(Operation):
     Performs the calculation of the nth root of a number.
     """
 
+    __slots__ = ()
+
 
     def validate_operands(self, a, b):
         """
@@ -225,7 +243,6 @@ class Root(Operation):
         :raises ValidationError: If the number is negative or the degree is less than or equal to zero.
         """
 
-        super().validate_operands(a, b)
         if a < 0:
             raise ValidationError("Cannot calculate the root of a negative number.")
         if b <= 0:
@@ -240,7 +257,8 @@ class Root(Operation):
         :return: Result of the root operation
         """
         self.validate_operands(a, b)
-        return Decimal(pow(float(a), 1 / float(b)))
+        # same kernel as Calculation, so the shown and the stored result agree
+        return _root(a, b)
     
 
 class Modulus(Operation):
@@ -249,6 +267,8 @@ class Modulus(Operation):
     Performs the modulus operation, which returns the remainder of the division of two numbers.
     """
 
+    __slots__ = ()
+
     def validate_operands(self, a, b):
         """
         Validate the operands for the modulus operation.
@@ -261,7 +281,6 @@ class Modulus(Operation):
         :raises ValidationError: If the second operand is zero.
         """
         
-        super().validate_operands(a, b)
         if b == 0:
             raise ValidationError("Modulus by zero is not allowed.")
         
@@ -284,6 +303,8 @@ class IntegerDivision(Operation):
     It is different from regular division in that it returns an integer result.
     """
 
+    __slots__ = ()
+
     def validate_operands(self, a, b):
         """
         Validate the operands for the integer division operation.
@@ -297,7 +318,6 @@ class IntegerDivision(Operation):
         """
 
 
-        super().validate_operands(a, b)
         if b == 0:
             raise ValidationError("Integer division by zero is not allowed.")
         
@@ -320,6 +340,8 @@ class Percentage(Operation):
 
     """
 
+    __slots__ = ()
+
     def validate_operands(self, a, b):
 
         """
@@ -333,7 +355,6 @@ class Percentage(Operation):
         :raises ValidationError: If the base value is zero.
         """
         
-        super().validate_operands(a, b)
         if b == 0:
             raise ValidationError("Cannot calculate percentage with zero base value.")
         
@@ -359,6 +380,8 @@ class AbsoluteDifference(Operation):
 
     Performs the calculation of the absolute difference between two numbers.
     """
+
+    __slots__ = ()
     
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
@@ -382,9 +405,12 @@ class OperationFactory:
     This class provides a way to create instances of various mathematical operations
     based on the operation type. It uses a dictionary to map operation names to their
     corresponding classes. New operations can be registered dynamically.
+    Operations hold no state, so each one is created once and the same instance
+    is returned by later calls.
 
     Attributes:
         _operations (Dict[str, type]): A dictionary mapping operation names to their classes.
+        _instances (Dict[str, Operation]): A dictionary mapping operation names to their created instances.
 
     """
 
@@ -401,6 +427,8 @@ class OperationFactory:
         "absolutedifference": AbsoluteDifference
     }   
 
+    _instances: Dict[str, Operation] = {}
+
     @classmethod
     def register_operation(cls, name: str, operation_class: type) -> None:
         """
@@ -418,7 +446,10 @@ class OperationFactory:
 
         if not issubclass(operation_class, Operation):
             raise TypeError("operation_class must be a subclass of Operation")
-        cls._operations[name.lower()] = operation_class
+        name = name.lower()
+        cls._operations[name] = operation_class
+        # drop the instance of a replaced class so the new class is used
+        cls._instances.pop(name, None)
 
 
     @classmethod
@@ -427,7 +458,7 @@ class OperationFactory:
         Create an instance of the specified operation type.
 
         This method retrieves the operation class from the _operation dictionary
-        and creates an instance of it.
+        and creates an instance of it on first use; later calls return the same instance.
 
         Args:
             operation_type (str): The type of operation to create (e.g., "add",
@@ -440,10 +471,21 @@ class OperationFactory:
             ValueError: If the operation type is not recognized.
         """
 
-        operation_class = cls._operations.get(operation_type.lower())
-        if not operation_class:
-            raise ValueError(f"Unknown operation type: {operation_type}")
-        return operation_class()
+        try:
+            # names already in lowercase, as the REPL passes them, hit the cache directly
+            return cls._instances[operation_type]
+        except KeyError:
+            pass
+
+        name = operation_type.lower()
+        operation = cls._instances.get(name)
+        if operation is None:
+            try:
+                operation_class = cls._operations[name]
+            except KeyError:
+                raise ValueError(f"Unknown operation type: {operation_type}") from None
+            operation = cls._instances[name] = operation_class()
+        return operation
     
 
 
@@ -10,11 +10,13 @@ including operation execution, error handling, serialization, and string represe
 """
 
 import pytest
+from dataclasses import FrozenInstanceError
 from decimal import Decimal
 from datetime import datetime
-from app.calculation import Calculation
+from app.calculation import Calculation, _OPERATIONS, _float_power, evaluate
 from app.exceptions import OperationError
 import logging
+from unittest.mock import patch
 
 ######################
 # Test Cases for Calculation.calculate
@@ -89,6 +91,30 @@ def test_calculate_absolute_difference():
     calc = Calculation(operation='AbsoluteDifference', operand1=Decimal('5.0'), operand2=Decimal('3.0'))
     assert calc.result == Decimal('2.0')
 
+def test_operation_aliases_are_canonicalized():
+    """Factory command names are accepted and stored under the canonical name."""
+    calc = Calculation(operation="integerdivision", operand1=Decimal("7"), operand2=Decimal("2"))
+    assert calc.operation == "IntegerDivision"
+    assert calc.result == Decimal("3")
+
+    loaded = Calculation.from_dict({
+        "operation": "add",
+        "operand1": "2",
+        "operand2": "3",
+        "result": "5",
+        "timestamp": datetime.now().isoformat()
+    })
+    assert loaded.operation == "Addition"
+
+def test_evaluate_matches_calculation():
+    """evaluate() returns the same result as a Calculation, without building one."""
+    assert evaluate("Power", Decimal("2"), Decimal("10")) == Decimal("1024")
+    assert evaluate("percentage", Decimal("25"), Decimal("200")) == Decimal("12.5")
+    with pytest.raises(OperationError, match="Division by zero is not allowed."):
+        evaluate("divide", Decimal("1"), Decimal("0"))
+    with pytest.raises(OperationError, match="Unknown operation: invalid_operation"):
+        evaluate("invalid_operation", Decimal("1"), Decimal("2"))
+
 def test_calculate_unknown_operation():
     with pytest.raises(OperationError, match="Unknown operation: invalid_operation"):
         Calculation(operation='invalid_operation', operand1=Decimal('5.0'), operand2=Decimal('3.0'))
@@ -108,6 +134,12 @@ def test_calculation_failed_exception():
         )
 
 
+def test_calculation_failed_exception_fast_path():
+    """Overflow in the inline addition/subtraction/multiplication path is wrapped too."""
+    with pytest.raises(OperationError, match="Calculation failed"):
+        Calculation(operation="Multiplication", operand1=Decimal('9e999999'), operand2=Decimal('10'))
+
+
 def test_to_dict():
     calc = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
     result_dict = calc.to_dict()
@@ -119,6 +151,15 @@ def test_to_dict():
         "timestamp": calc.timestamp.isoformat()
     }
 
+def test_to_dict_is_cached_and_copied():
+    """Repeated serialization reuses cached strings but returns independent dicts."""
+    calc = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
+    first = calc.to_dict()
+    first["result"] = "tampered"
+    second = calc.to_dict()
+    assert second["result"] == "5"
+    assert second is not first
+
 def test_from_dict():
     data = {
         "operation": "Addition",
@@ -134,6 +175,61 @@ def test_from_dict():
     assert calc.result == Decimal("5")
 
 
+def test_from_dict_trusts_saved_result():
+    """By default the saved result is used as-is instead of being recalculated."""
+    data = {
+        "operation": "Addition",
+        "operand1": "2",
+        "operand2": "3",
+        "result": "5",
+        "timestamp": datetime.now().isoformat()
+    }
+    with patch.object(Calculation, "calculate") as mock_calculate:
+        calc = Calculation.from_dict(data)
+    mock_calculate.assert_not_called()
+    assert calc.result == Decimal("5")
+    assert calc.timestamp == datetime.fromisoformat(data["timestamp"])
+
+def test_from_dict_reuses_parsed_decimals():
+    """Repeated operand strings are parsed once and shared between calculations."""
+    data = {
+        "operation": "Multiplication",
+        "operand1": "12.5",
+        "operand2": "12.5",
+        "result": "156.25",
+        "timestamp": datetime.now().isoformat()
+    }
+    calc1 = Calculation.from_dict(data)
+    calc2 = Calculation.from_dict(dict(data))
+    assert calc1.operand1 is calc2.operand1
+    assert calc1.operand1 is calc1.operand2
+
+def test_from_dict_unknown_operation():
+    data = {
+        "operation": "invalid_operation",
+        "operand1": "2",
+        "operand2": "3",
+        "result": "5",
+        "timestamp": datetime.now().isoformat()
+    }
+    with pytest.raises(OperationError, match="Unknown operation: invalid_operation"):
+        Calculation.from_dict(data)
+
+def test_from_dict_verify_recalculates():
+    """With verify=True the result is recalculated and mismatches are logged."""
+    data = {
+        "operation": "Addition",
+        "operand1": "2",
+        "operand2": "3",
+        "result": "6",
+        "timestamp": datetime.now().isoformat()
+    }
+    with patch("app.calculation.logger.warning") as mock_warning:
+        calc = Calculation.from_dict(data, verify=True)
+    assert calc.result == Decimal("5")
+    assert calc.timestamp == datetime.fromisoformat(data["timestamp"])
+    mock_warning.assert_called_once()
+
 def test_invalid_from_dict():
     data = {
         "operation": "Addition",
@@ -165,6 +261,14 @@ def test_equality():
     assert calc1 == calc2
     assert calc1 != calc3
 
+def test_equal_calculations_hash_equal():
+    """Equal calculations can be deduplicated through a set."""
+    calc1 = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
+    calc2 = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
+    calc3 = Calculation(operation="Addition", operand1=Decimal("3"), operand2=Decimal("2"))
+    assert hash(calc1) == hash(calc2)
+    assert len({calc1, calc2, calc3}) == 2
+
 def test_equality_with_non_calculation_object():
     """Test equality comparison with non-Calculation objects (covers line 283)."""
     calc = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
@@ -183,8 +287,73 @@ def test_format_result():
     assert calc.format_result(precision=0) == "0"
 
 
-
-
-
-
-
+def test_inline_operations_match_dispatch_table():
+    """The inlined fast path must agree with the dispatch table entries it shadows."""
+    a, b = Decimal("7.5"), Decimal("2.5")
+    for name in ("Addition", "Subtraction", "Multiplication"):
+        calc = Calculation(operation=name, operand1=a, operand2=b)
+        assert calc.result == _OPERATIONS[name](a, b)
+
+def test_operation_name_is_interned():
+    """Operation names built at runtime are canonicalized to one shared string."""
+    name = "".join(["Addi", "tion"])
+    calc1 = Calculation(operation=name, operand1=Decimal("1"), operand2=Decimal("2"))
+    calc2 = Calculation(operation="Addition", operand1=Decimal("3"), operand2=Decimal("4"))
+    assert calc1.operation is calc2.operation
+
+def test_power_and_root_are_memoized():
+    """Repeated fractional power and root calculations are served from the cache."""
+    _float_power.cache_clear()
+    for _ in range(3):
+        Calculation(operation="Power", operand1=Decimal("2"), operand2=Decimal("0.5"))
+        Calculation(operation="Root", operand1=Decimal("27"), operand2=Decimal("3"))
+    assert _float_power.cache_info().hits == 4
+
+def test_calculate_power_integral_exponent_is_exact():
+    """Integral exponents keep full Decimal precision."""
+    calc = Calculation(operation="Power", operand1=Decimal("1.1"), operand2=Decimal("20"))
+    assert calc.result == Decimal("1.1") ** 20
+    assert calc.result == Decimal("6.72749994932560009201")
+
+def test_calculate_power_integral_exponent_is_not_rounded():
+    """Integral powers longer than the default 28-digit context stay exact."""
+    calc = Calculation(operation="Power", operand1=Decimal("2"), operand2=Decimal("100"))
+    assert calc.result == Decimal(2 ** 100)
+
+def test_calculate_power_too_long_for_exact_result_uses_float():
+    """Integral powers too long to hold exactly fall back to float math."""
+    calc = Calculation(operation="Power", operand1=Decimal("1.1"), operand2=Decimal("5000"))
+    assert calc.result == _float_power(Decimal("1.1"), 5000.0)
+
+def test_calculate_power_accepts_int_and_float_operands():
+    """Power works with plain int and float operands, not only Decimal."""
+    assert Calculation(operation="Power", operand1=2, operand2=10).result == Decimal("1024")
+    assert Calculation(operation="Power", operand1=1.5, operand2=2.0).result == Decimal("2.25")
+    assert Calculation(operation="Power", operand1=4, operand2=0.5).result == Decimal("2")
+
+def test_calculate_power_beyond_float_range_fails():
+    """Integral powers too large for a float fail like the float path instead of storing huge numbers."""
+    with pytest.raises(OperationError, match="Calculation failed"):
+        Calculation(operation="Power", operand1=Decimal("9"), operand2=Decimal("400"))
+    # the largest results still within float range stay exact
+    assert Calculation(operation="Power", operand1=Decimal("2"), operand2=Decimal("1000")).result == Decimal(2 ** 1000)
+
+def test_calculate_power_zero_to_zero():
+    calc = Calculation(operation="Power", operand1=Decimal("0"), operand2=Decimal("0"))
+    assert calc.result == Decimal("1")
+
+def test_calculation_uses_slots():
+    """Calculation instances do not carry a per-instance __dict__."""
+    calc = Calculation(operation="Addition", operand1=Decimal("1"), operand2=Decimal("2"))
+    assert not hasattr(calc, "__dict__")
+
+def test_calculation_is_frozen():
+    """Fields cannot be reassigned once the calculation has been created."""
+    calc = Calculation(operation="Addition", operand1=Decimal("1"), operand2=Decimal("2"))
+    with pytest.raises(FrozenInstanceError):
+        calc.result = Decimal("4")
+
+def test_calculate_power_negative_base_fractional_exponent():
+    """A negative base with a fractional exponent has no real result."""
+    with pytest.raises(OperationError, match="Calculation failed"):
+        Calculation(operation="Power", operand1=Decimal("-8"), operand2=Decimal("0.5"))
@@ -12,19 +12,24 @@ configuration handling, logging, and error scenarios.
 
 import datetime
 import logging
+import os
 from pathlib import Path
 import pandas as pd
 import pytest
+import subprocess
+import sys
+import threading
 from unittest.mock import Mock, patch, PropertyMock
 from decimal import Decimal
 from tempfile import TemporaryDirectory
 
-from app.calculator import Calculator
+from app.calculation import Calculation
+from app.calculator import Calculator, _cached_execute
 from app.calculator_repl import start_calculator_repl
 from app.calculator_config import CalculatorConfig
 from app.exceptions import OperationError, ValidationError
 from app.history import LoggingObserver, AutoSaverObserver
-from app.operations import OperationFactory
+from app.operations import OperationFactory, Power
 
 # fixute to create a temporary directory for testing
 @pytest.fixture
@@ -52,26 +57,32 @@ def calculator():
 #  Test for Calculator initialization
 def test_calculator_initialization(calculator):
     """Test that Calculator initializes with the provided configuration."""
-    assert calculator.history == []
-    assert calculator.undo_stack == []
-    assert calculator.redo_stack == []
+    assert list(calculator.history) == []
+    assert list(calculator.undo_stack) == []
+    assert list(calculator.redo_stack) == []
     assert calculator.operation_strategy is None
 
+def test_calculator_uses_slots(calculator):
+    """Test that Calculator instances have no per-instance __dict__."""
+    assert not hasattr(calculator, '__dict__')
+    with pytest.raises(AttributeError):
+        calculator.unknown_attribute = 1
+
 def test_calculator_initialization_with_config_is_none(calculator):
     """Test that Calculator initializes with a default configuration."""
     calculator = Calculator()
     assert calculator.config is not None
     assert isinstance(calculator.config, CalculatorConfig)
-    assert calculator.history == []
-    assert calculator.undo_stack == []
-    assert calculator.redo_stack == []
+    assert list(calculator.history) == []
+    assert list(calculator.undo_stack) == []
+    assert list(calculator.redo_stack) == []
     assert calculator.operation_strategy is None
 
 
 
 # Test Logging Setup
 
-@patch('app.calculator.logging.info')
+@patch('app.calculator.logger.info')
 def test_logging_setup(logging_info_mock):
     with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
          patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file:
@@ -106,8 +117,8 @@ def test_setup_logging_failed(mock_print):
 
     
 # Test for logging history failed
-@patch('app.calculator.logging.warning')
-@patch('app.calculator.logging.info')
+@patch('app.calculator.logger.warning')
+@patch('app.calculator.logger.info')
 def test_calculator_init_logging_history_failed(logging_info_mock, logging_warning_mock):
     """Test that logging setup is called during calculator initialization."""
     with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
@@ -123,11 +134,51 @@ def test_calculator_init_logging_history_failed(logging_info_mock, logging_warni
             calculator = Calculator(CalculatorConfig())
             
             # Verify the warning was logged
-            logging_warning_mock.assert_called_once_with("Failed to load existing history: Failed to load history")
+            logging_warning_mock.assert_called_once()
+            message, error = logging_warning_mock.call_args[0]
+            assert message % error == "Failed to load existing history: Failed to load history"
             # Verify initialization still completed successfully
             logging_info_mock.assert_any_call("Calculator initialized with configuration")
 
         
+def test_ensure_dir_skips_existing_directory(calculator, tmp_path):
+    """Test that _ensure_dir only calls mkdir for a missing directory."""
+    target = tmp_path / 'nested' / 'dir'
+    calculator._ensure_dir(target)
+    assert target.is_dir()
+    with patch.object(Path, 'mkdir') as mock_mkdir:
+        calculator._ensure_dir(target)
+    mock_mkdir.assert_not_called()
+
+def test_ensure_dir_recreates_deleted_directory(calculator, tmp_path):
+    """Test that a directory removed while the process runs is created again."""
+    target = tmp_path / 'dir'
+    calculator._ensure_dir(target)
+    target.rmdir()
+    calculator._ensure_dir(target)
+    assert target.is_dir()
+
+def test_history_paths_follow_config(tmp_path, monkeypatch):
+    """Test that saves and loads use the config's current history paths."""
+    for name in ('CALCULATOR_LOG_DIR', 'CALCULATOR_HISTORY_DIR', 'CALCULATOR_LOG_FILE', 'CALCULATOR_HISTORY_FILE'):
+        monkeypatch.delenv(name, raising=False)
+    config = CalculatorConfig(base_dir=tmp_path, auto_save=False)
+    calculator = Calculator(config=config)
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    calculator.save_history()
+    assert (tmp_path / 'history' / 'calculator_history.csv').exists()
+
+    # moving the history takes effect once the cached paths are invalidated
+    config.base_dir = tmp_path / 'moved'
+    config.invalidate_paths()
+    calculator.save_history()
+    moved = tmp_path / 'moved' / 'history' / 'calculator_history.csv'
+    assert list(pd.read_csv(moved, dtype=str)['result']) == ['3']
+    calculator.clear_history()
+    calculator.load_history()
+    assert [str(c.result) for c in calculator.history] == ['3']
+
 # Test for adding, removing and notifying observers
 def test_add_observer(calculator):
     """Test for adding an observer."""
@@ -142,6 +193,13 @@ def test_remove_observer(calculator):
     calculator.remove_observer(observer)
     assert observer not in calculator.observers
 
+def test_remove_unregistered_observer(calculator):
+    """Test that removing an observer that was never added raises ValueError."""
+    calculator.add_observer(LoggingObserver())
+    with pytest.raises(ValueError):
+        calculator.remove_observer(LoggingObserver())
+    assert len(calculator.observers) == 1
+
 def test_notify_observers(calculator):
     """Test for notifying observers."""
     observer = LoggingObserver()
@@ -158,6 +216,41 @@ def test_notify_observers(calculator):
     observer.update(calculation)  # This should not raise an error
 
 
+def test_notify_observers_uses_registered_updates(calculator):
+    """Test that every registered observer is updated until it is removed."""
+    first, second = Mock(), Mock()
+    calculator.add_observer(first)
+    calculator.add_observer(second)
+    calculator.notify_observers('calc')
+    calculator.remove_observer(first)
+    calculator.notify_observers('calc')
+    assert first.update.call_count == 1
+    assert second.update.call_count == 2
+
+def test_observer_can_remove_itself_during_notification(calculator):
+    """Test that removing an observer while notifying still updates the others."""
+    second = Mock()
+    first = Mock()
+    first.update.side_effect = lambda calculation: calculator.remove_observer(first)
+    calculator.add_observer(first)
+    calculator.add_observer(second)
+    calculator.notify_observers('calc')
+    second.update.assert_called_once_with('calc')
+    assert calculator.observers == (second,)
+
+def test_notify_observers_without_observers(calculator):
+    """Test that notifying with no registered observers is a no-op."""
+    calculator.notify_observers(Mock())
+    assert calculator.observers == ()
+
+def test_perform_operation_notifies_observers(calculator):
+    """Test that perform_operation passes the new calculation to observers."""
+    observer = Mock()
+    calculator.add_observer(observer)
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(2, 3)
+    observer.update.assert_called_once_with(calculator.history[-1])
+
 # Test for performing operations
 def test_perform_operation_addition(calculator):
     """Test for performing addition operation."""
@@ -166,6 +259,74 @@ def test_perform_operation_addition(calculator):
     result = calculator.perform_operation(5, 4)
     assert result == Decimal('9')
 
+def test_set_operation_stores_operation_name(calculator):
+    """Test that the strategy name is computed when the strategy is set, not per calculation."""
+    operation = OperationFactory.create_operation('multiply')
+    calculator.set_operation(operation)
+    with patch.object(type(operation), '__str__', side_effect=AssertionError("str() called")):
+        calculator.perform_operation(2, 3)
+    assert calculator.history[-1].operation == 'Multiplication'
+    # assigning the attribute directly keeps the name in step
+    calculator.operation_strategy = OperationFactory.create_operation('subtract')
+    calculator.perform_operation(2, 3)
+    assert calculator.history[-1].operation == 'Subtraction'
+
+def test_perform_operation_memoizes_expensive_operations(calculator):
+    """Test that repeated root operations reuse the cached result."""
+    _cached_execute.cache_clear()
+    calculator.set_operation(OperationFactory.create_operation('root'))
+    assert calculator.perform_operation(2, '3') == calculator.perform_operation(2, '3')
+    assert _cached_execute.cache_info().hits == 1
+    # cheap operations bypass the cache
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(2, 3)
+    assert _cached_execute.cache_info().currsize == 1
+
+def test_perform_operation_does_not_memoize_power(calculator):
+    """Test that power results keep their operands' exponent instead of a cached form."""
+    _cached_execute.cache_clear()
+    calculator.set_operation(OperationFactory.create_operation('power'))
+    assert str(calculator.perform_operation(2, 3)) == '8'
+    assert _cached_execute.cache_info().currsize == 0
+    assert str(Power().execute(Decimal('2.0'), Decimal('3'))) == '8.000'
+    assert str(Power().execute(Decimal('2'), Decimal('3'))) == '8'
+
+def test_perform_operation_memoized_validation_error(calculator):
+    """Test that validation errors from memoized operations are not cached."""
+    calculator.set_operation(OperationFactory.create_operation('root'))
+    for _ in range(2):
+        with pytest.raises(ValidationError, match="Cannot calculate the root of a negative number."):
+            calculator.perform_operation(-8, 3)
+
+def test_perform_operation_caches_validated_strings(calculator):
+    """Test that repeated operand strings are validated once per input limit."""
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    with patch('app.calculator.InputValidator.validate_number', return_value=Decimal('5')) as mock_validate:
+        calculator.perform_operation('5', '5')
+        calculator.perform_operation('5', 5)
+        assert mock_validate.call_count == 2
+        # a new limit invalidates the cached entry
+        calculator.config.max_input_value = Decimal('10')
+        calculator.perform_operation('5', 5)
+        assert mock_validate.call_count == 4
+
+def test_validation_cache_is_bounded(calculator):
+    """Test that the validation cache never grows past its size."""
+    for value in range(300):
+        calculator._validate_operand(str(value))
+    assert len(calculator._validated) == 256
+
+def test_validation_cache_evicts_least_recently_used(calculator):
+    """Test that a full validation cache keeps recently used operands."""
+    for value in range(256):
+        calculator._validate_operand(str(value))
+    calculator._validate_operand('0')
+    calculator._validate_operand('256')
+    keys = [key for key, _ in calculator._validated]
+    assert '0' in keys
+    assert '1' not in keys
+    assert keys[-1] == '256'
+
 def test_perform_operation_validation_error(calculator):
     """Test for validation error when performing operation."""
     calculator.set_operation(OperationFactory.create_operation('add'))
@@ -188,6 +349,83 @@ def test_perform_operation_exception(calculator):
     with pytest.raises(OperationError, match="Operation failed"):
         calculator.perform_operation(5, 4)
 
+def test_perform_operation_exception_is_chained(calculator):
+    """Test that calculation errors are wrapped with the original as the cause."""
+    operation = Mock()
+    operation.execute.side_effect = ArithmeticError("boom")
+    calculator.set_operation(operation)
+    with pytest.raises(OperationError, match="Operation failed: boom") as exc_info:
+        calculator.perform_operation(5, 4)
+    assert isinstance(exc_info.value.__cause__, ArithmeticError)
+
+def test_perform_operation_unexpected_error_propagates(calculator):
+    """Test that errors a calculation cannot raise are not wrapped."""
+    operation = Mock()
+    operation.execute.side_effect = RuntimeError("boom")
+    calculator.set_operation(operation)
+    with pytest.raises(RuntimeError, match="boom"):
+        calculator.perform_operation(5, 4)
+    assert list(calculator.history) == []
+
+def test_try_perform_operation(calculator):
+    """Test that expected failures are returned as messages instead of raised."""
+    calculator.set_operation(OperationFactory.create_operation('divide'))
+    assert calculator.try_perform_operation(6, 3) == (Decimal('2'), None)
+    result, error = calculator.try_perform_operation("five", 3)
+    assert result is None and "Invalid number format" in error
+    result, error = calculator.try_perform_operation(6, 0)
+    assert result is None and "Division by zero" in error
+    assert len(calculator.history) == 1
+
+def test_perform_operations_batch(calculator):
+    """Test that a batch gives the same results and history as single operations."""
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    observer = Mock()
+    calculator.add_observer(observer)
+    results = calculator.perform_operations([(1, 2), ('3', '4'), (5, 6)])
+    assert results == [Decimal('3'), Decimal('7'), Decimal('11')]
+    assert [calc.result for calc in calculator.history] == results
+    observer.update_batch.assert_called_once_with(list(calculator.history))
+    observer.update.assert_not_called()
+    # each calculation is undone separately
+    assert calculator.undo()
+    assert [calc.result for calc in calculator.history] == [Decimal('3'), Decimal('7')]
+
+def test_perform_operations_evicts_and_memoizes(calculator):
+    """Test that a batch respects the history size cap and memoized operations."""
+    calculator.config.max_history_size = 2
+    calculator.set_operation(OperationFactory.create_operation('power'))
+    assert calculator.perform_operations([(2, 2), (2, 3), (2, 4)]) == [Decimal('4'), Decimal('8'), Decimal('16')]
+    assert [calc.result for calc in calculator.history] == [Decimal('8'), Decimal('16')]
+    assert calculator.undo()
+    assert [calc.result for calc in calculator.history] == [Decimal('4'), Decimal('8')]
+    calculator.set_operation(OperationFactory.create_operation('root'))
+    assert calculator.perform_operations([(16, 2), (16, 2)]) == [Decimal('4'), Decimal('4')]
+
+def test_perform_operations_failure_leaves_history_unchanged(calculator):
+    """Test that one failing pair aborts the whole batch."""
+    calculator.set_operation(OperationFactory.create_operation('divide'))
+    calculator.perform_operation(8, 2)
+    with pytest.raises(ValidationError, match="Division by zero is not allowed."):
+        calculator.perform_operations([(1, 1), (1, 0)])
+    with pytest.raises(OperationError, match="Operation failed"):
+        calculator.perform_operations([(1, 1, 1)])
+    assert [calc.result for calc in calculator.history] == [Decimal('4')]
+    assert len(calculator.undo_stack) == 1
+
+def test_perform_operations_empty_batch(calculator):
+    """Test that an empty batch does nothing and notifies no observers."""
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    observer = Mock()
+    calculator.add_observer(observer)
+    assert calculator.perform_operations([]) == []
+    observer.update_batch.assert_not_called()
+
+def test_perform_operations_without_operation(calculator):
+    """Test that a batch requires an operation to be set."""
+    with pytest.raises(OperationError, match="No operation set"):
+        calculator.perform_operations([(1, 2)])
+
 
 
 # Test for undo and redo operations
@@ -216,6 +454,49 @@ def test_redo_operation(calculator):
     # check that the history has one entry after redo
     assert len(calculator.history) == 1
 
+def test_undo_redo_restores_evicted_calculation(calculator):
+    """Test that undo and redo respect the history size cap."""
+    calculator.config.max_history_size = 2
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    for a in range(3):
+        calculator.perform_operation(a, 1)
+    assert [calc.result for calc in calculator.history] == [Decimal('2'), Decimal('3')]
+    # undo brings back the calculation dropped by the cap
+    assert calculator.undo() is True
+    assert [calc.result for calc in calculator.history] == [Decimal('1'), Decimal('2')]
+    # redo drops it again
+    assert calculator.redo() is True
+    assert [calc.result for calc in calculator.history] == [Decimal('2'), Decimal('3')]
+    assert calculator.undo_stack[-1].evicted.result == Decimal('1')
+
+def test_mementos_share_calculations_with_history(calculator):
+    """Test that undo entries reference history calculations instead of copying them."""
+    calculator.config.max_history_size = 1
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    first = calculator.history[0]
+    calculator.perform_operation(3, 4)
+    memento = calculator.undo_stack[-1]
+    assert memento.added is calculator.history[0]
+    assert memento.evicted is first
+    calculator.undo()
+    assert calculator.history[0] is first
+
+def test_undo_stack_is_bounded(calculator):
+    """Test that the undo stack keeps at most max_history_size steps."""
+    cap = calculator.config.max_history_size
+    assert calculator.undo_stack.maxlen == cap
+    assert calculator.redo_stack.maxlen == cap
+
+def test_undo_stack_follows_max_history_size(calculator):
+    """Test that the undo and redo stacks are resized with the history cap."""
+    calculator.config.max_history_size = 2
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    for a in range(4):
+        calculator.perform_operation(a, 1)
+    assert calculator.undo_stack.maxlen == calculator.redo_stack.maxlen == 2
+    assert len(calculator.undo_stack) == 2
+
 #Test for undo and redo operations with empty stacks
 def test_undo_empty_stack(calculator):
     """Test for undoing when the undo stack is empty."""
@@ -231,8 +512,7 @@ def test_redo_empty_stack(calculator):
    
 
 # Test for saving and loading history
-@patch('app.calculator.pd.DataFrame.to_csv')
-def test_save_history(mock_to_csv, calculator):
+def test_save_history(calculator):
     """Test for saving history to CSV file."""
     # create an operation and perform it
     operation = OperationFactory.create_operation('add')
@@ -242,21 +522,19 @@ def test_save_history(mock_to_csv, calculator):
     # save the history
     calculator.save_history()
     
-    # check that to_csv was called
-    mock_to_csv.assert_called_once()
+    # check that the file holds the header and the calculation
+    df = pd.read_csv(calculator.config.history_file, dtype=str)
+    assert list(df.columns) == ['operation', 'operand1', 'operand2', 'result', 'timestamp']
+    assert df.iloc[0]['operation'] == 'Addition'
+    assert df.iloc[0]['result'] == '9'
 
-@patch('app.calculator.pd.read_csv')
-@patch('app.calculator.Path.exists', return_value=True)
-def test_load_history(mock_exists, mock_read_csv, calculator):
+def test_load_history(calculator):
     """Test for loading history from CSV file."""
-    # mock CSV data to match expected format in from_dict
-    mock_read_csv.return_value = pd.DataFrame({
-        'operation': ['Addition'],
-        'operand1': ['3'],
-        'operand2': ['4'],
-        'result': ['7'],
-        'timestamp': [datetime.datetime.now().isoformat()]
-    })
+    # write CSV data to match expected format in from_dict
+    calculator.config.history_file.write_text(
+        "operation,operand1,operand2,result,timestamp\n"
+        f"Addition,3,4,7,{datetime.datetime.now().isoformat()}\n"
+    )
 
     # Test loading history functionality
     try:
@@ -269,6 +547,292 @@ def test_load_history(mock_exists, mock_read_csv, calculator):
     except OperationError:
         pytest.fail("Loading history raised an OperationError unexpectedly")
 
+def test_save_and_load_history_round_trip(calculator):
+    """Test that saved operands are loaded back exactly, without float conversion."""
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation('0.1', '0.2')
+    calculator.save_history()
+    calculator.clear_history()
+    calculator.load_history()
+    assert len(calculator.history) == 1
+    assert str(calculator.history[0].operand1) == '0.1'
+    assert calculator.history[0].result == Decimal('0.3')
+
+def test_save_history_appends_new_calculations(calculator):
+    """Test that later saves append new rows instead of rewriting the file."""
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    calculator.save_history()
+    calculator.perform_operation(3, 4)
+    with patch('builtins.open', wraps=open) as mock_open:
+        calculator.save_history()
+    # the file is opened for appending, not truncated
+    assert mock_open.call_args[0][1] == 'a'
+    df = pd.read_csv(calculator.config.history_file, dtype=str)
+    assert list(df['result']) == ['3', '7']
+
+def test_save_history_appends_after_eviction(calculator):
+    """Test that rows evicted by the size cap are appended past, not rewritten."""
+    calculator.config.max_history_size = 1
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    calculator.save_history()
+    calculator.perform_operation(3, 4)
+    with patch('builtins.open', wraps=open) as mock_open:
+        calculator.save_history()
+    assert mock_open.call_args[0][1] == 'a'
+    # loading keeps only the newest rows allowed by the cap
+    calculator.load_history()
+    assert [calc.result for calc in calculator.history] == [Decimal('7')]
+
+def test_load_history_parses_only_retained_rows(calculator):
+    """Test that rows beyond the history cap are not turned into calculations."""
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    for a in range(5):
+        calculator.perform_operation(a, 1)
+    calculator.save_history()
+    calculator.config.max_history_size = 2
+    with patch('app.calculator.Calculation.from_dict', wraps=Calculation.from_dict) as mock_from_dict:
+        calculator.load_history()
+    assert mock_from_dict.call_count == 2
+    assert [calc.result for calc in calculator.history] == [Decimal('4'), Decimal('5')]
+
+def test_save_history_rotates_large_file(calculator):
+    """Test that an oversized history file is backed up and rewritten."""
+    calculator.config.max_history_size = 1
+    calculator.config.max_history_bytes = 1
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    calculator.save_history()
+    calculator.perform_operation(3, 4)
+    calculator.save_history()
+    backup = pd.read_csv(str(calculator.config.history_file) + '.bak', dtype=str)
+    current = pd.read_csv(calculator.config.history_file, dtype=str)
+    assert list(backup['result']) == ['3', '7']
+    assert list(current['result']) == ['7']
+
+def test_save_history_rotation_starts_small_file(calculator):
+    """Test that a history larger than the byte limit does not rotate on every save."""
+    calculator.config.max_history_bytes = 600
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    for i in range(20):
+        calculator.perform_operation(i, 1)
+    calculator.save_history()
+    assert os.path.getsize(calculator.config.history_file) > 600
+
+    # the first append rotates and starts a file with only the newest rows
+    calculator.perform_operation(100, 1)
+    calculator.save_history()
+    backup = str(calculator.config.history_file) + '.bak'
+    backup_rows = pd.read_csv(backup, dtype=str)
+    current = pd.read_csv(calculator.config.history_file, dtype=str)
+    assert len(backup_rows) == 21
+    assert os.path.getsize(calculator.config.history_file) <= 300 + len('operation,operand1,operand2,result,timestamp') + 2
+    assert list(current['result'])[-1] == '101'
+
+    # the next append fits under the limit, so the backup is left alone
+    calculator.perform_operation(200, 1)
+    calculator.save_history()
+    assert len(pd.read_csv(backup, dtype=str)) == 21
+    assert list(pd.read_csv(calculator.config.history_file, dtype=str)['result'])[-2:] == ['101', '201']
+    assert len(calculator.history) == 22
+
+def test_save_and_load_history_parquet(calculator):
+    """Test that the parquet format writes and reads through pandas."""
+    calculator.config.history_format = 'parquet'
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation('0.1', '0.2')
+    with patch('pandas.DataFrame.to_parquet') as mock_to_parquet:
+        calculator.save_history()
+    mock_to_parquet.assert_called_once_with(str(calculator.config.history_file), index=False)
+    saved = calculator.get_history_dataframe()
+
+    # stand-in for the file to_parquet would have written
+    calculator.config.history_file.write_bytes(b'PAR1')
+    with patch('pandas.read_parquet', return_value=saved) as mock_read_parquet:
+        calculator.clear_history()
+        calculator.load_history()
+    mock_read_parquet.assert_called_once_with(str(calculator.config.history_file))
+    assert str(calculator.history[0].operand1) == '0.1'
+    assert calculator.history[0].result == Decimal('0.3')
+
+def test_parquet_history_round_trip(tmp_path, monkeypatch):
+    """Test that a real Parquet history file is written and loaded back."""
+    pytest.importorskip('pyarrow')
+    for name in ('CALCULATOR_LOG_DIR', 'CALCULATOR_HISTORY_DIR', 'CALCULATOR_LOG_FILE', 'CALCULATOR_HISTORY_FILE'):
+        monkeypatch.delenv(name, raising=False)
+    config = CalculatorConfig(base_dir=tmp_path, history_format='parquet', auto_save=False)
+    calculator = Calculator(config=config)
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation('0.1', '0.2')
+    calculator.save_history()
+
+    history_file = calculator.config.history_file
+    assert history_file.name == 'calculator_history.parquet'
+    assert history_file.read_bytes()[:4] == b'PAR1'
+
+    reloaded = Calculator(config=CalculatorConfig(base_dir=tmp_path, history_format='parquet', auto_save=False))
+    assert str(reloaded.history[0].operand1) == '0.1'
+    assert reloaded.history[0].result == Decimal('0.3')
+
+def test_unsaved_calculations_are_bounded(calculator):
+    """Test that unsaved calculations are capped at the history size and still load back."""
+    calculator.config.max_history_size = 2
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 1)
+    calculator.save_history()
+    for value in range(2, 6):
+        calculator.perform_operation(value, value)
+    assert len(calculator._unflushed) == 2
+    calculator.save_history()
+    calculator.load_history()
+    assert [calc.result for calc in calculator.history] == [Decimal('8'), Decimal('10')]
+
+def test_save_history_streams_rows_to_file(calculator):
+    """Test that saving hands the csv writer a lazy row iterator, not a built-up buffer."""
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    with patch('app.calculator.csv.writer') as mock_writer:
+        calculator.save_history()
+    rows = mock_writer.return_value.writerows.call_args[0][0]
+    assert not isinstance(rows, (list, tuple, str))
+    assert list(rows)[0][:4] == ('Addition', '1', '2', '3')
+
+def test_save_history_skips_unchanged_history(calculator):
+    """Test that saving twice without changes does not touch the file."""
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    calculator.save_history()
+    with patch('builtins.open', wraps=open) as mock_open:
+        calculator.save_history()
+    mock_open.assert_not_called()
+
+def test_save_history_rewrites_after_undo(calculator):
+    """Test that undo forces a full rewrite so the undone row leaves the file."""
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    calculator.perform_operation(3, 4)
+    calculator.save_history()
+    calculator.undo()
+    calculator.perform_operation(5, 6)
+    calculator.save_history()
+    df = pd.read_csv(calculator.config.history_file, dtype=str)
+    assert list(df['result']) == ['3', '11']
+
+def test_schedule_save_writes_history_in_background(calculator):
+    """Test that a scheduled save writes the history once flushed."""
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    calculator.schedule_save()
+    calculator.perform_operation(3, 4)
+    calculator.schedule_save()
+    calculator.flush()
+    df = pd.read_csv(calculator.config.history_file, dtype=str)
+    assert list(df['result']) == ['3', '7']
+
+def test_schedule_save_cancels_queued_save(calculator):
+    """Test that scheduling a save cancels one that has not started yet."""
+    queued = Mock()
+    calculator._pending_save = queued
+    calculator.schedule_save()
+    queued.cancel.assert_called_once()
+    calculator.flush()
+
+def test_flush_raises_background_save_error(calculator):
+    """Test that flush re-raises an error from the background save."""
+    with patch('app.calculator.csv.writer', side_effect=Exception("Disk full")):
+        calculator.schedule_save()
+        with pytest.raises(OperationError, match="Failed to save history: Disk full"):
+            calculator.flush()
+
+def test_flush_raises_error_of_replaced_save(calculator):
+    """Test that a failed save is still reported after a newer save replaced it."""
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    with patch('app.calculator.csv.writer', side_effect=Exception("Disk full")):
+        calculator.schedule_save()
+        calculator._pending_save.result()
+    calculator.schedule_save()
+    with pytest.raises(OperationError, match="Failed to save history: Disk full"):
+        calculator.flush()
+    # the failure is reported once, and the later save went through
+    calculator.flush()
+    df = pd.read_csv(calculator.config.history_file, dtype=str)
+    assert list(df['result']) == ['3']
+
+def test_flush_without_scheduled_save(calculator):
+    """Test that flush is a no-op when nothing was scheduled."""
+    calculator.flush()
+    assert calculator._pending_save is None
+
+def test_close_stops_save_thread(calculator):
+    """Test that close finishes the scheduled save and shuts the executor down."""
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    calculator.schedule_save()
+    executor = calculator._save_executor
+    calculator.close()
+    assert executor._shutdown
+    assert calculator._save_executor is None
+    df = pd.read_csv(calculator.config.history_file, dtype=str)
+    assert list(df['result']) == ['3']
+    # closing again, or without anything scheduled, does nothing
+    calculator.close()
+
+def test_close_stops_save_thread_after_failed_save(calculator):
+    """Test that close reports a failed background save and still stops the thread."""
+    with patch('app.calculator.csv.writer', side_effect=Exception("Disk full")):
+        calculator.schedule_save()
+        executor = calculator._save_executor
+        with pytest.raises(OperationError, match="Failed to save history: Disk full"):
+            calculator.close()
+    assert executor._shutdown
+    assert calculator._save_executor is None
+
+def test_save_history_writes_outside_history_lock(calculator):
+    """Test that the history lock is free while the file is being written."""
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    acquired = []
+
+    def take_lock():
+        if calculator._lock.acquire(timeout=1):
+            acquired.append(True)
+            calculator._lock.release()
+
+    def write(*args):
+        # another thread, like the REPL performing a calculation, can take the lock
+        thread = threading.Thread(target=take_lock)
+        thread.start()
+        thread.join()
+
+    with patch.object(Calculator, '_write_history', autospec=True, side_effect=write):
+        calculator.save_history()
+    assert acquired == [True]
+
+def test_save_history_rewrites_after_failed_write(calculator):
+    """Test that a save following a failed write rewrites the whole file."""
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    calculator.save_history()
+    calculator.perform_operation(3, 4)
+    with patch('app.calculator.csv.writer', side_effect=Exception("Disk full")):
+        with pytest.raises(OperationError, match="Failed to save history: Disk full"):
+            calculator.save_history()
+    assert calculator._rewrite_history
+    calculator.save_history()
+    df = pd.read_csv(calculator.config.history_file, dtype=str)
+    assert list(df['result']) == ['3', '7']
+
+def test_history_shares_operation_strings(calculator):
+    """Test that performed and loaded calculations share one operation string."""
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    calculator.save_history()
+    performed = calculator.history[0]
+    calculator.load_history()
+    assert calculator.history[0].operation is performed.operation
+
 def test_clear_history(calculator):
     """Test for clearing the history."""
     # create an operation and perform it
@@ -280,9 +844,9 @@ def test_clear_history(calculator):
     calculator.clear_history()
     
     # check that the history is empty
-    assert calculator.history == []
-    assert calculator.undo_stack == []
-    assert calculator.redo_stack == []
+    assert list(calculator.history) == []
+    assert list(calculator.undo_stack) == []
+    assert list(calculator.redo_stack) == []
 
 def test_save_history_with_empty_history(calculator):
     """Test saving history when history is empty."""
@@ -291,9 +855,32 @@ def test_save_history_with_empty_history(calculator):
     # Save the history
     calculator.save_history()
     # Check that no error is raised and history remains empty
-    assert calculator.history == []
-    assert calculator.undo_stack == []
-    assert calculator.redo_stack == []
+    assert list(calculator.history) == []
+    assert list(calculator.undo_stack) == []
+    assert list(calculator.redo_stack) == []
+
+def test_load_history_empty_file(calculator):
+    """Test that loading a header-only history file keeps the history empty."""
+    calculator.save_history()
+    with patch('app.calculator.logger.info') as mock_logging_info:
+        calculator.load_history()
+    mock_logging_info.assert_called_once_with("Loaded empty history file, no calculations found.")
+    assert list(calculator.history) == []
+
+@pytest.mark.parametrize('history_format', ['csv', 'parquet'])
+def test_load_history_zero_byte_file(calculator, history_format):
+    """Test that a zero-byte history file loads as empty without reading it."""
+    calculator.config.history_format = history_format
+    calculator.config.history_file.write_bytes(b'')
+    with patch('builtins.open') as mock_open, patch('pandas.read_parquet') as mock_read_parquet:
+        calculator.load_history()
+    mock_open.assert_not_called()
+    mock_read_parquet.assert_not_called()
+    assert list(calculator.history) == []
+    # the next save writes a complete file again
+    calculator.config.history_format = 'csv'
+    calculator.save_history()
+    assert calculator.config.history_file.read_text().startswith('operation,')
 
 # Test history management negative cases
 
@@ -313,27 +900,30 @@ def test_history_exceeds_max_size(calculator):
 def test_saving_history_exception(calculator):
     """Test that saving history raises an exception when file cannot be written."""
     # Mock the to_csv method to raise an exception
-    with patch('app.calculator.pd.DataFrame.to_csv', side_effect=Exception("File write error")):
+    with patch('app.calculator.csv.writer', side_effect=Exception("File write error")):
         with pytest.raises(OperationError, match="Failed to save history: File write error"):
             calculator.save_history()
 
-@patch('app.calculator.logging.error')
+@patch('app.calculator.logger.error')
 def test_load_history_exception(mock_logging_error, calculator):
     """Test that load_history handles exceptions correctly."""
     # Clear any existing history
     calculator.history.clear()
     
-    # Mock pd.read_csv to raise an exception
-    with patch('app.calculator.pd.read_csv') as mock_read_csv:
-        mock_read_csv.side_effect = Exception("CSV read failed")
+    # write an empty history file so we enter the try block
+    calculator.save_history()
+
+    # Mock csv.reader to raise an exception
+    with patch('app.calculator.csv.reader') as mock_reader:
+        mock_reader.side_effect = Exception("CSV read failed")
         
-        # Mock pathlib.Path.exists to return True so we enter the try block
-        with patch('pathlib.Path.exists', return_value=True):
-            with pytest.raises(OperationError, match="Failed to load history: CSV read failed"):
-                calculator.load_history()
-            
-            # Verify the error was logged
-            mock_logging_error.assert_called_once_with("Failed to load history: CSV read failed")
+        with pytest.raises(OperationError, match="Failed to load history: CSV read failed"):
+            calculator.load_history()
+        
+        # Verify the error was logged
+        mock_logging_error.assert_called_once()
+        message, error = mock_logging_error.call_args[0]
+        assert message % error == "Failed to load history: CSV read failed"
 
 
 def test_get_history_dataframe(calculator):
@@ -350,10 +940,57 @@ def test_get_history_dataframe(calculator):
     expected_columns = ['operation', 'operand1', 'operand2', 'result', 'timestamp']
     
     # Check that the DataFrame has one row with correct data
+    assert list(df.columns) == expected_columns
     assert len(df) == 1
     assert df.iloc[0]['operation'] == 'Addition'
     assert df.iloc[0]['result'] == '9'
 
+def test_get_history_dataframe_is_cached_until_history_changes(calculator):
+    """Test that the DataFrame is rebuilt only after the history changes."""
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(5, 4)
+    first = calculator.get_history_dataframe()
+    cached = calculator._df_cache
+    first.loc[0, 'result'] = 'changed'
+    second = calculator.get_history_dataframe()
+    # callers get copies of the same cached frame
+    assert calculator._df_cache is cached
+    assert second.iloc[0]['result'] == '9'
+    calculator.perform_operation(1, 1)
+    assert len(calculator.get_history_dataframe()) == 2
+    calculator.undo()
+    assert len(calculator.get_history_dataframe()) == 1
+
+def test_get_history_dataframe_empty(calculator):
+    """Test that an empty history still produces the expected columns."""
+    df = calculator.get_history_dataframe()
+    assert df.empty
+    assert list(df.columns) == ['operation', 'operand1', 'operand2', 'result', 'timestamp']
+
+def test_import_does_not_load_pandas():
+    """Test that importing the calculator does not pull in pandas."""
+    code = "import sys, app.calculator; sys.exit('pandas' in sys.modules)"
+    assert subprocess.run([sys.executable, '-c', code]).returncode == 0
+
+def test_csv_history_round_trip_does_not_load_heavy_modules(tmp_path):
+    """Test that saving and loading CSV history needs neither pandas nor concurrent.futures."""
+    code = (
+        "import sys\n"
+        "from pathlib import Path\n"
+        "from app.calculator import Calculator\n"
+        "from app.calculator_config import CalculatorConfig\n"
+        "from app.operations import OperationFactory\n"
+        "calc = Calculator(CalculatorConfig(base_dir=Path(sys.argv[1])))\n"
+        "calc.set_operation(OperationFactory.create_operation('add'))\n"
+        "calc.perform_operation(2, 2)\n"
+        "calc.save_history()\n"
+        "calc.load_history()\n"
+        "sys.exit('pandas' in sys.modules or 'concurrent.futures' in sys.modules)\n"
+    )
+    env = {k: v for k, v in os.environ.items() if not k.startswith('CALCULATOR_')}
+    result = subprocess.run([sys.executable, '-c', code, str(tmp_path)], env=env)
+    assert result.returncode == 0
+
 def test_show_history(calculator):
     """Test that show_history returns a list of formatted strings."""
     # Perform an operation
@@ -367,6 +1004,16 @@ def test_show_history(calculator):
     assert len(history_list) == 1
     assert history_list[0] == "Addition(5, 4) = 9"
 
+def test_format_history(calculator):
+    """Test that format_history joins the show_history entries with newlines."""
+    assert calculator.format_history() == ""
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(5, 4)
+    calculator.set_operation(OperationFactory.create_operation('subtract'))
+    calculator.perform_operation(9, 4)
+    assert calculator.format_history() == "Addition(5, 4) = 9\nSubtraction(9, 4) = 5"
+    assert calculator.format_history() == "\n".join(calculator.show_history())
+
 
 
 
@@ -0,0 +1,47 @@
+###############################
+# test_calculator_memento.py
+###############################
+
+"""
+Unit tests for the CalculatorMemento class.
+
+This module checks that delta mementos serialize to and from dictionaries
+without losing the recorded calculations.
+"""
+
+import datetime
+from decimal import Decimal
+
+from app.calculation import Calculation
+from app.calculator_memento import CalculatorMemento
+
+
+def test_memento_round_trip_with_evicted():
+    """Test that a memento with an evicted calculation survives a dict round trip."""
+    added = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
+    evicted = Calculation(operation="Power", operand1=Decimal("2"), operand2=Decimal("3"))
+    memento = CalculatorMemento(added=added, evicted=evicted)
+
+    restored = CalculatorMemento.from_dict(memento.to_dict())
+
+    assert restored.added == added
+    assert restored.evicted == evicted
+    assert restored.timestamp == memento.timestamp
+
+
+def test_memento_round_trip_without_evicted():
+    """Test that a memento without an evicted calculation restores None."""
+    added = Calculation(operation="Subtraction", operand1=Decimal("5"), operand2=Decimal("3"))
+    memento = CalculatorMemento(added=added, timestamp=datetime.datetime(2024, 1, 1))
+
+    data = memento.to_dict()
+
+    assert data['evicted'] is None
+    assert data['timestamp'] == "2024-01-01T00:00:00"
+    assert CalculatorMemento.from_dict(data).evicted is None
+
+
+def test_memento_uses_slots():
+    """Test that mementos, created once per calculation, carry no __dict__."""
+    added = Calculation(operation="Addition", operand1=Decimal("1"), operand2=Decimal("2"))
+    assert not hasattr(CalculatorMemento(added=added), '__dict__')
@@ -44,6 +44,39 @@ def test_run_calculator_repl_exit_with_error(mock_print, mock_input):
         mock_print.assert_any_call(f"{Fore.GREEN}Exiting calculator REPL. Goodbye!{Style.RESET_ALL}")
 
 
+# Test case for exit command when a background auto-save failed
+@patch('builtins.input', side_effect=['exit'])
+@patch('builtins.print')
+@patch('app.calculator_repl.Calculator')
+def test_run_calculator_repl_exit_retries_failed_auto_save(mock_calculator_class, mock_print, mock_input):
+    """Test that a failed background save is retried by the exit save and not reported when that succeeds."""
+    mock_calc = Mock()
+    mock_calc.close.side_effect = OperationError("Failed to save history: Disk full")
+    mock_calculator_class.return_value = mock_calc
+    start_calculator_repl()
+    mock_calc.close.assert_called_once()
+    mock_calc.save_history.assert_called_once()
+    assert [c.args for c in mock_print.call_args_list[1:]] == [
+        (f"{Fore.GREEN}History saved successfully.{Style.RESET_ALL}",),
+        (f"{Fore.GREEN}Exiting calculator REPL. Goodbye!{Style.RESET_ALL}",),
+    ]
+
+# Test case for exit command when both a background save and the exit save fail
+@patch('builtins.input', side_effect=['exit'])
+@patch('builtins.print')
+@patch('app.calculator_repl.Calculator')
+def test_run_calculator_repl_exit_reports_save_error_once(mock_calculator_class, mock_print, mock_input):
+    """Test that exit reports a single warning when the retry of a failed auto-save also fails."""
+    mock_calc = Mock()
+    mock_calc.close.side_effect = OperationError("Failed to save history: Disk full")
+    mock_calc.save_history.side_effect = OperationError("Failed to save history: Disk full")
+    mock_calculator_class.return_value = mock_calc
+    start_calculator_repl()
+    assert [c.args for c in mock_print.call_args_list[1:]] == [
+        (f"{Fore.RED}Warning: Could not save history before exiting: Failed to save history: Disk full{Style.RESET_ALL}",),
+        (f"{Fore.GREEN}Exiting calculator REPL. Goodbye!{Style.RESET_ALL}",),
+    ]
+
 
 # Test case for displaying help in the REPL
 @patch('builtins.input', side_effect=['help', 'exit'])
@@ -53,9 +86,13 @@ def test_run_calculator_repl_help(mock_print, mock_input):
     with patch('app.calculator.Calculator.save_history') as mock_save_history:
         start_calculator_repl()
         mock_save_history.assert_called_once()  # save_history is called during exit
-        mock_print.assert_any_call(f"{Fore.GREEN}\nAvailable commands:")
-        mock_print.assert_any_call("  add, subtract, multiply, divide, power, root, modulus, integerdivision, percentage, absolutedifference")
-        mock_print.assert_any_call(f"  exit - Exit the calculator REPL{Style.RESET_ALL}")
+        # the help text is printed with a single call
+        help_text = next(call.args[0] for call in mock_print.call_args_list if "Available commands:" in call.args[0])
+        lines = help_text.split("\n")
+        assert lines[0] == f"{Fore.GREEN}"
+        assert lines[1] == "Available commands:"
+        assert "  add, subtract, multiply, divide, power, root, modulus, integerdivision, percentage, absolutedifference" in lines
+        assert lines[-1] == f"  exit - Exit the calculator REPL{Style.RESET_ALL}"
 
 # Test case for performing a valid addition operation and history saving
 @patch('builtins.input', side_effect=['add', '2', '3', 'history', 'exit'])
@@ -67,7 +104,7 @@ def test_run_calculator_repl_history_with_calculations(mock_calculator_class, mo
     mock_calc = Mock()
     # Mock the show_history to return some calculations when called
     mock_calc.show_history.return_value = [
-        "Addition(2, 3) = 5"]
+        "Addition(2, 3) = 5", "Multiplication(4, 5) = 20"]
     mock_calc.add_observer = Mock()
     mock_calc.set_operation = Mock()
     mock_calc.perform_calculation.side_effect = [5, 20]  # Return values for calculations
@@ -79,7 +116,10 @@ def test_run_calculator_repl_history_with_calculations(mock_calculator_class, mo
     mock_calc.save_history.assert_called()
     # Verify the correct messages for history with calculations
     mock_print.assert_any_call(f"{Fore.GREEN}\nCalculation History:{Style.RESET_ALL}")
-    mock_print.assert_any_call(f"{Fore.GREEN}1. Addition(2, 3) = 5{Style.RESET_ALL}")
+    mock_print.assert_any_call(
+        f"{Fore.GREEN}1. Addition(2, 3) = 5{Style.RESET_ALL}\n"
+        f"{Fore.GREEN}2. Multiplication(4, 5) = 20{Style.RESET_ALL}"
+    )
     
 # Test case for history command with no calculations in history
 @patch('builtins.input', side_effect=['history', 'exit'])
@@ -335,15 +375,15 @@ def test_run_calculator_repl_normalize_result(mock_calculator_class, mock_print,
     
     # Create a Decimal result that needs normalization (e.g., 5.00 -> 5)
     decimal_result = Decimal('5.00')
-    mock_calc.perform_operation.return_value = decimal_result
+    mock_calc.try_perform_operation.return_value = (decimal_result, None)
     mock_calculator_class.return_value = mock_calc
     
     start_calculator_repl()
     
     # Verify that the result was printed (normalized from 5.00 to 5)
     mock_print.assert_any_call(f"{Fore.GREEN}\nResult: 5{Style.RESET_ALL}")
-    # Verify perform_operation was called
-    mock_calc.perform_operation.assert_called_once()
+    # Verify try_perform_operation was called
+    mock_calc.try_perform_operation.assert_called_once()
 
 # Test case for addition operation in the REPL
 @patch('builtins.input', side_effect=['add', '2', '3', 'exit'])
@@ -367,7 +407,7 @@ def test_run_calculator_repl_operation_error(mock_calculator_class, mock_print,
     mock_calc.add_observer = Mock()
     mock_calc.set_operation = Mock()
     # Simulate an OperationError for division by zero
-    mock_calc.perform_operation.side_effect = OperationError("Division by zero is not allowed.")
+    mock_calc.try_perform_operation.return_value = (None, str(OperationError("Division by zero is not allowed.")))
     mock_calculator_class.return_value = mock_calc
     
     start_calculator_repl()
@@ -386,7 +426,7 @@ def test_run_calculator_repl_validation_error(mock_calculator_class, mock_print,
     mock_calc.add_observer = Mock()
     mock_calc.set_operation = Mock()
     # Simulate a ValidationError for invalid input
-    mock_calc.perform_operation.side_effect = ValidationError("Invalid input")
+    mock_calc.try_perform_operation.return_value = (None, str(ValidationError("Invalid input")))
     mock_calculator_class.return_value = mock_calc
     
     start_calculator_repl()
@@ -405,7 +445,7 @@ def test_run_calculator_repl_unexpected_error(mock_calculator_class, mock_print,
     mock_calc.add_observer = Mock()
     mock_calc.set_operation = Mock()
     # Simulate an unexpected exception
-    mock_calc.perform_operation.side_effect = Exception("Unexpected error")
+    mock_calc.try_perform_operation.side_effect = Exception("Unexpected error")
     mock_calculator_class.return_value = mock_calc
     
     start_calculator_repl()
@@ -447,6 +487,20 @@ def test_run_calculator_repl_eof_error(mock_calculator_class, mock_print, mock_i
     
     # Verify the correct message for EOFError
     mock_print.assert_any_call(f"{Fore.GREEN}\nInput terminated by user. Exiting REPL....{Style.RESET_ALL}")
+    # pending background saves are finished and the save thread stopped before leaving
+    mock_calc.close.assert_called_once()
+
+# Test case for EOF when a background auto-save failed
+@patch('builtins.input', side_effect=EOFError())
+@patch('builtins.print')
+@patch('app.calculator_repl.Calculator')
+def test_run_calculator_repl_eof_reports_auto_save_error(mock_calculator_class, mock_print, mock_input):
+    """Test that EOF reports a failed background save."""
+    mock_calc = Mock()
+    mock_calc.close.side_effect = OperationError("Failed to save history: Disk full")
+    mock_calculator_class.return_value = mock_calc
+    start_calculator_repl()
+    mock_print.assert_any_call(f"{Fore.RED}Warning: Could not save history before exiting: Failed to save history: Disk full{Style.RESET_ALL}")
 
 # Test case for other unexpected errors in the REPL
 @patch('builtins.input', side_effect=RuntimeError("Command processing error"))
@@ -484,3 +538,27 @@ def test_run_calculator_repl_initialization_error(mock_calculator_class, mock_pr
 
 
 
+
+
+# Test that the dispatch tables cover every command exactly once
+def test_repl_dispatch_tables():
+    """Test that every arithmetic command maps to a factory operation and no command is handled twice."""
+    from app.calculator_repl import _ARITHMETIC_COMMANDS, _COMMAND_HANDLERS
+    from app.operations import OperationFactory
+
+    for command in _ARITHMETIC_COMMANDS:
+        OperationFactory.create_operation(command)
+    assert not _ARITHMETIC_COMMANDS & _COMMAND_HANDLERS.keys()
+    assert set(_COMMAND_HANDLERS) == {'help', 'exit', 'history', 'clear', 'undo', 'redo', 'load', 'save'}
+
+
+# Test that commands typed with different case or padding are still recognized
+@patch('builtins.input', side_effect=['  HELP ', 'Bogus ', 'exit'])
+@patch('builtins.print')
+@patch('app.calculator_repl.Calculator')
+def test_run_calculator_repl_normalizes_commands(mock_calculator_class, mock_print, mock_input):
+    """Test that commands are lowercased and stripped when they do not match exactly."""
+    mock_calculator_class.return_value = Mock()
+    start_calculator_repl()
+    assert any("Available commands:" in call.args[0] for call in mock_print.call_args_list)
+    mock_print.assert_any_call(f"{Fore.GREEN}Unknown command: 'bogus'. Type 'help' for available commands.{Style.RESET_ALL}")
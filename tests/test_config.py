@@ -16,7 +16,8 @@ import pytest
 import os
 from decimal import Decimal
 from pathlib import Path
-from app.calculator_config import CalculatorConfig
+from unittest.mock import patch
+from app.calculator_config import CalculatorConfig, parquet_engine_available
 from app.exceptions import ConfigurationError
 
 
@@ -37,7 +38,8 @@ def clear_env_vars(*args):
 
 
 
-def test_default_config():
+def test_default_config(monkeypatch):
+    monkeypatch.setenv('CALCULATOR_MAX_HISTORY_BYTES', '4096')
     config = CalculatorConfig()
     
     assert config.max_history_size == 100
@@ -45,6 +47,8 @@ def test_default_config():
     assert config.precision == 5
     assert config.max_input_value == Decimal('1000000')
     assert config.default_encoding == 'utf-8'
+    assert config.max_history_bytes == 4096
+    assert config.history_format == 'csv'
     assert config.log_dir == Path('./test_logs').resolve()
     assert config.history_dir == Path('./test_history').resolve()
     assert config.log_file == Path('./test_logs/test_log.log').resolve()
@@ -58,12 +62,16 @@ def test_custom_config():
         precision=6,
         max_input_value=Decimal('5000'),
         default_encoding='ascii',
+        max_history_bytes=2048,
+        history_format='PARQUET',
     )
     assert config.max_history_size == 1000
     assert config.auto_save is True
     assert config.precision == 6
     assert config.max_input_value == Decimal('5000')
     assert config.default_encoding == 'ascii'
+    assert config.max_history_bytes == 2048
+    assert config.history_format == 'parquet'
 
 
 def test_dir_properties():
@@ -81,6 +89,12 @@ def test_file_properties():
     assert config.log_file == Path('./custom_base_dir/logs/calculator.log').resolve()
     assert config.history_file == Path('./custom_base_dir/history/calculator_history.csv').resolve()
 
+def test_parquet_history_file_name():
+    """Test that the default history file name follows the history format."""
+    clear_env_vars('CALCULATOR_HISTORY_FILE', 'CALCULATOR_HISTORY_DIR')
+    config = CalculatorConfig(base_dir=Path('./custom_base_dir'), history_format='parquet')
+    assert config.history_file == Path('./custom_base_dir/history/calculator_history.parquet').resolve()
+
 def test_invalid_max_history_size():
     """Test invalid max history size."""
     with pytest.raises(ConfigurationError, match="Maximum history size must be a positive integer."):
@@ -102,4 +116,79 @@ def test_invalid_max_input_value():
         config.validate()
 
 
+def test_invalid_max_history_bytes():
+    """Test invalid max history file size."""
+    with pytest.raises(ConfigurationError, match="Maximum history file size must be a positive integer."):
+        config = CalculatorConfig(max_history_bytes=-1)
+        config.validate()
+
+
+def test_invalid_history_format():
+    """Test invalid history file format."""
+    with pytest.raises(ConfigurationError, match="History format must be 'csv' or 'parquet'."):
+        config = CalculatorConfig(history_format='xml')
+        config.validate()
+
+
+def test_parquet_format_requires_engine():
+    """Test that the parquet format is rejected when no Parquet engine is installed."""
+    config = CalculatorConfig(history_format='parquet')
+    with patch('app.calculator_config.parquet_engine_available', return_value=False):
+        with pytest.raises(ConfigurationError, match="requires pyarrow or fastparquet"):
+            config.validate()
+    with patch('app.calculator_config.parquet_engine_available', return_value=True):
+        config.validate()
+
+
+def test_parquet_engine_available():
+    """Test that the engine check looks the engines up without importing them."""
+    with patch('app.calculator_config.importlib.util.find_spec', return_value=None) as mock_find_spec:
+        assert parquet_engine_available() is False
+    assert [c.args[0] for c in mock_find_spec.call_args_list] == ['pyarrow', 'fastparquet']
+
+
+def test_path_properties_are_cached():
+    """Test that path properties are resolved once until invalidated."""
+    clear_env_vars('CALCULATOR_LOG_DIR', 'CALCULATOR_HISTORY_DIR', 'CALCULATOR_LOG_FILE', 'CALCULATOR_HISTORY_FILE')
+    config = CalculatorConfig(base_dir=Path('./custom_base_dir'))
+    history_file = config.history_file
+    assert config.history_file is history_file
+
+    config.base_dir = Path('./other_base_dir')
+    assert config.history_dir == Path('./custom_base_dir/history').resolve()
+    config.invalidate_paths()
+    assert config.history_dir == Path('./other_base_dir/history').resolve()
+    assert config.history_file == Path('./other_base_dir/history/calculator_history.csv').resolve()
+
+
+def test_history_format_change_renames_history_file():
+    """Test that changing the history format resolves the history file again."""
+    clear_env_vars('CALCULATOR_HISTORY_DIR', 'CALCULATOR_HISTORY_FILE')
+    config = CalculatorConfig(base_dir=Path('./custom_base_dir'))
+    assert config.history_file.name == 'calculator_history.csv'
+    config.history_format = 'parquet'
+    assert config.history_file.name == 'calculator_history.parquet'
+
+
+def test_falsy_arguments_are_kept():
+    """Test that explicit falsy values are not replaced by the defaults."""
+    config = CalculatorConfig(precision=0, auto_save=False, max_history_size=0)
+    assert config.precision == 0
+    assert config.auto_save is False
+    assert config.max_history_size == 0
+    with pytest.raises(ConfigurationError, match="Maximum history size must be a positive integer."):
+        config.validate()
+
+
+def test_auto_save_env_false(monkeypatch):
+    """Test that CALCULATOR_AUTO_SAVE=false disables auto-save."""
+    monkeypatch.setenv('CALCULATOR_AUTO_SAVE', 'false')
+    assert CalculatorConfig().auto_save is False
+
 
+def test_config_uses_slots():
+    """Test that CalculatorConfig instances have no per-instance __dict__."""
+    config = CalculatorConfig()
+    assert not hasattr(config, '__dict__')
+    with pytest.raises(AttributeError):
+        config.unknown_setting = 1
@@ -10,12 +10,14 @@ including LoggingObserver and AutoSaverObserver functionality.
 """
 
 import logging
+from pathlib import Path
 import pytest
 from unittest.mock import Mock, patch
 from app.calculation import Calculation
 from app.history import LoggingObserver, AutoSaverObserver
 from app.calculator import Calculator
 from app.calculator_config import CalculatorConfig
+from app.operations import OperationFactory
 
 
 
@@ -37,8 +39,24 @@ def test_logging_observer_logs_calculation(mock_logging_info):
     observer = LoggingObserver()
     observer.update(calculation_mock)
     logging.info.assert_called_once_with(
-        f"Calculation performed: addition (6, 2) = 8"
+        "Calculation performed: %s (%s, %s) = %s", 'addition', 6, 2, 8
     )
+    message, *args = logging.info.call_args[0]
+    assert message % tuple(args) == "Calculation performed: addition (6, 2) = 8"
+
+
+def test_logging_observer_skips_formatting_when_info_disabled():
+    """Test that LoggingObserver does not format the calculation when INFO is filtered out."""
+    calculation = Mock(spec=Calculation)
+    calculation.operation = 'Addition'
+    calculation.result.__str__ = Mock(side_effect=AssertionError("result formatted"))
+    root = logging.getLogger()
+    level = root.level
+    root.setLevel(logging.WARNING)
+    try:
+        LoggingObserver().update(calculation)
+    finally:
+        root.setLevel(level)
 
 def test_logging_observer_none_calculation():
     """Test LoggingObserver raises AttributeError when calculation is None."""
@@ -56,9 +74,32 @@ def test_autosave_observer_triggers_save():
     calculator_mock.config.auto_save = True
     observer = AutoSaverObserver(calculator_mock)
     observer.update(calculation_mock)
+    calculator_mock.schedule_save.assert_called_once()
+    calculator_mock.save_history.assert_not_called()
+
+
+def test_autosave_observer_saves_directly_without_background_saving():
+    """Test that AutoSaverObserver falls back to save_history for calculators without schedule_save."""
+    calculator_mock = Mock(spec=['config', 'save_history'])
+    calculator_mock.config = CalculatorConfig(auto_save=True)
+    observer = AutoSaverObserver(calculator_mock)
+    observer.update(calculation_mock)
     calculator_mock.save_history.assert_called_once()
 
 
+def test_autosave_observer_writes_history_in_background(tmp_path, monkeypatch):
+    """Test that auto-saving a real calculator writes the history file once flushed."""
+    for name in ('CALCULATOR_LOG_DIR', 'CALCULATOR_HISTORY_DIR', 'CALCULATOR_LOG_FILE', 'CALCULATOR_HISTORY_FILE'):
+        monkeypatch.delenv(name, raising=False)
+    calculator = Calculator(CalculatorConfig(base_dir=tmp_path, auto_save=True))
+    calculator.add_observer(AutoSaverObserver(calculator))
+    calculator.set_operation(OperationFactory.create_operation('add'))
+    calculator.perform_operation(1, 2)
+    calculator.perform_operation(3, 4)
+    calculator.flush()
+    assert calculator.config.history_file.read_text().count('Addition') == 2
+
+
 @patch('logging.info')
 def test_autosave_observer_does_not_trigger_save_when_auto_save_disabled(mock_logging_info):
     """Test that AutoSaverObserver does not trigger save when auto_save is False."""
@@ -90,4 +131,43 @@ def test_autosave_observer_no_calculation():
     observer = AutoSaverObserver(calculator_mock)
 
     with pytest.raises(AttributeError):
-        observer.update(None)
\ No newline at end of file
+        observer.update(None)
+
+def test_logging_observer_update_batch_logs_each_calculation():
+    """Test that the default update_batch passes every calculation to update."""
+    observer = LoggingObserver()
+    with patch.object(LoggingObserver, 'update') as mock_update:
+        observer.update_batch([calculation_mock, calculation_mock])
+    assert mock_update.call_count == 2
+
+
+def test_autosave_observer_update_batch_saves_once():
+    """Test that AutoSaverObserver saves a whole batch with a single save."""
+    calculator_mock = Mock(spec=Calculator)
+    calculator_mock.config = CalculatorConfig(auto_save=True)
+    observer = AutoSaverObserver(calculator_mock)
+    observer.update_batch([calculation_mock, calculation_mock, calculation_mock])
+    calculator_mock.schedule_save.assert_called_once()
+
+
+def test_autosave_observer_update_batch_respects_auto_save():
+    """Test that AutoSaverObserver does not save a batch when auto-save is disabled."""
+    calculator_mock = Mock(spec=Calculator)
+    calculator_mock.config = CalculatorConfig(auto_save=False)
+    observer = AutoSaverObserver(calculator_mock)
+    observer.update_batch([calculation_mock])
+    calculator_mock.schedule_save.assert_not_called()
+    calculator_mock.save_history.assert_not_called()
+
+
+def test_autosave_observer_refresh_config():
+    """Test that the auto-save setting is cached until refresh_config is called."""
+    calculator_mock = Mock(spec=Calculator)
+    calculator_mock.config = CalculatorConfig(auto_save=False)
+    observer = AutoSaverObserver(calculator_mock)
+    calculator_mock.config.auto_save = True
+    observer.update(calculation_mock)
+    calculator_mock.schedule_save.assert_not_called()
+    observer.refresh_config()
+    observer.update(calculation_mock)
+    calculator_mock.schedule_save.assert_called_once()
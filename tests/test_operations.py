@@ -21,6 +21,7 @@ from app.operations import (
     OperationFactory,
 )
 
+from app.calculation import Calculation
 from app.exceptions import ValidationError
 
 
@@ -35,6 +36,12 @@ class TestOperation:
             
         assert str(TestOP()) == "TestOP"  # str representation should be class name
 
+    def test_operations_have_no_instance_dict(self):
+        """ Test that the built-in operations are slotted and carry no __dict__ """
+        for operation_class in OperationFactory._operations.values():
+            if operation_class.__module__ == Operation.__module__:
+                assert not hasattr(operation_class(), '__dict__'), operation_class.__name__
+
 class BaseOperationTest:
     """ A base operation for testing purposes """
     
@@ -77,6 +84,7 @@ class TestAddition(BaseOperationTest):
         "negative_integers": {"a": -5, "b": -3, "expected": -8},
         "mixed_integers": {"a": 5, "b": -3, "expected": 2},
         "decimal_numbers": {"a": 5.5, "b": 3.2, "expected": 8.7},
+        "inexact_in_binary": {"a": 0.1, "b": 0.2, "expected": 0.3},
         "zero": {"a": 0, "b": 0, "expected": 0},
         "large_numbers": {"a": 1e10, "b": 1e10, "expected": 2e10},
     }
@@ -93,6 +101,7 @@ class TestSubtraction(BaseOperationTest):
         "negative_integers": {"a": -5, "b": -3, "expected": -2},
         "mixed_integers": {"a": 5, "b": -3, "expected": 8},
         "decimal_numbers": {"a": 5.5, "b": 3.2, "expected": 2.3},
+        "inexact_in_binary": {"a": 0.3, "b": 0.1, "expected": 0.2},
         "zero": {"a": 0, "b": 0, "expected": 0},
         "large_numbers": {"a": 1e10, "b": 1e10, "expected": 0},
     }
@@ -110,6 +119,7 @@ class TestMultiplication(BaseOperationTest):
         "negative_integers": {"a": -5, "b": -3, "expected": 15},
         "mixed_integers": {"a": 5, "b": -3, "expected": -15},
         "decimal_numbers": {"a": 5.5, "b": 3.2, "expected": 17.6},
+        "inexact_in_binary": {"a": 0.1, "b": 3, "expected": 0.3},
         "zero": {"a": 0, "b": 0, "expected": 0},
         "large_numbers": {"a": 1e10, "b": 1e10, "expected": 1e20},
     }
@@ -173,6 +183,16 @@ class TestRoot(BaseOperationTest):
     }
 
 
+    def test_square_root_matches_calculation(self):
+        """ Test that Root gives the same square root as the stored Calculation """
+        import random
+        rng = random.Random(0)
+        values = [Decimal('432921.5913805363')] + [Decimal(repr(rng.uniform(0, 1e6))) for _ in range(2000)]
+        for a in values:
+            expected = Calculation(operation="Root", operand1=a, operand2=Decimal('2')).result
+            assert Root().execute(a, Decimal('2')) == expected, a
+
+
 class TestPower(BaseOperationTest):
     """ Test Power operation"""
 
@@ -183,6 +203,9 @@ class TestPower(BaseOperationTest):
         "one_exponent": {"a": 5, "b": 1, "expected": 5},
         "decimal_base": {"a": 2.5, "b": 2, "expected": 6.25},
         "zero_base": {"a": 0, "b": 5, "expected": 0},
+        "exact_beyond_float": {"a": 3, "b": 40, "expected": 12157665459056928801},
+        "fractional_exponent": {"a": 4, "b": 0.5, "expected": 2},
+        "longer_than_default_context": {"a": 2, "b": 100, "expected": 2 ** 100},
     }
     invalid_test_cases = {
         "negative_exponent": {
@@ -318,6 +341,27 @@ class TestOperationFactory:
         operation = OperationFactory.create_operation("new_op")
         assert isinstance(operation, NewOperation)
 
+    def test_create_operation_reuses_instance(self):
+        """Test that each operation is created once and then reused."""
+        operation = OperationFactory.create_operation("add")
+        assert OperationFactory.create_operation("ADD") is operation
+        assert OperationFactory.create_operation("subtract") is not operation
+
+    def test_register_operation_replaces_instance(self):
+        """Test that re-registering a name drops the instance of the old class."""
+        class FirstOperation(Operation):
+            def execute(self, a: Decimal, b: Decimal) -> Decimal:
+                return a
+
+        class SecondOperation(Operation):
+            def execute(self, a: Decimal, b: Decimal) -> Decimal:
+                return b
+
+        OperationFactory.register_operation("swap_op", FirstOperation)
+        assert isinstance(OperationFactory.create_operation("swap_op"), FirstOperation)
+        OperationFactory.register_operation("swap_op", SecondOperation)
+        assert isinstance(OperationFactory.create_operation("swap_op"), SecondOperation)
+
     def test_register_invalid_operation(self):
         """Test registering an invalid operation class."""
         class NotAnOperation:
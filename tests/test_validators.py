@@ -93,3 +93,10 @@ def test_validate_number_none():
     with pytest.raises(ValidationError, match="Invalid number format: None"):
         InputValidator.validate_number(None, config)
 
+
+def test_validate_number_string_checked_against_each_limit():
+    """Test that the same operand string is checked against the limit of each config."""
+    assert InputValidator.validate_number(' 12.50 ', config) == Decimal('12.5')
+    small_config = CalculatorConfig(max_input_value=Decimal('10'))
+    with pytest.raises(ValidationError, match="Input exceeds maximum allowed value"):
+        InputValidator.validate_number('12.50', small_config)